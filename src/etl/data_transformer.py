@@ -5,10 +5,11 @@ Clean Code: Principio de Responsabilidad Única - Solo transforma datos
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from abc import ABC, abstractmethod
 
 from config import (
@@ -26,6 +27,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patrones de trimestre compilados una sola vez
+# Formato: "2010 ene-mar", "2010 feb-abr", etc.
+_RE_QUARTER_MONTHS = re.compile(r'(\d{4})\s+(\w{3})-(\w{3})')
+# Formato: "2024-V04", "2024-V01", etc.
+_RE_QUARTER_V = re.compile(r'(\d{4})-V(\d{2})')
+
 
 class DataTransformer(ABC):
     """
@@ -87,10 +94,16 @@ class LosRiosDataTransformer(DataTransformer):
                 logger.error(f"Columnas faltantes: {missing_columns}")
                 return False
             
-            # Verificar que todos los registros son de Los Ríos
-            region_values = df[DATA_COLUMNS.REGION_CODE].unique()
-            if len(region_values) != 1 or region_values[0] != self.region_code:
-                logger.error(f"Datos contienen regiones distintas a {self.region_code}")
+            # Verificar que todos los registros son de Los Ríos (una máscara;
+            # los valores únicos solo se calculan si hay regiones inválidas)
+            regions = df[DATA_COLUMNS.REGION_CODE]
+            in_region = regions.eq(self.region_code)
+            if not in_region.all():
+                invalid_regions = regions[~in_region].unique()
+                logger.error(
+                    f"Datos contienen regiones distintas a {self.region_code}: "
+                    f"{list(invalid_regions[:10])}"
+                )
                 return False
             
             logger.info("Datos de entrada validados correctamente")
@@ -137,15 +150,31 @@ class LosRiosDataTransformer(DataTransformer):
         Returns:
             Dict con año, trimestre y fecha aproximada
         """
-        try:
-            # Patrones para diferentes formatos
-            # Formato: "2010 ene-mar", "2010 feb-abr", etc.
-            pattern1 = r'(\d{4})\s+(\w{3})-(\w{3})'
-            # Formato: "2024-V04", "2024-V01", etc.
-            pattern2 = r'(\d{4})-V(\d{2})'
+        year, quarter, month_start, date_approx = self._parse_quarter_cached(quarter_str)
+        return {
+            'year': year,
+            'quarter': quarter,
+            'month_start': month_start,
+            'date_approx': date_approx
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _parse_quarter_cached(quarter_str: str) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[str]]:
+        """
+        Parsear un trimestre a tupla (año, trimestre, mes_inicio, fecha_aprox)
+        Clean Code: Función pura memoizada (los trimestres se repiten por género)
+        
+        Args:
+            quarter_str: String como "2010 ene-mar" o "2024-V04"
             
-            match1 = re.match(pattern1, quarter_str)
-            match2 = re.match(pattern2, quarter_str)
+        Returns:
+            Tupla inmutable con año, trimestre, mes de inicio y fecha aproximada
+        """
+        try:
+            # Patrones precompilados; el segundo solo se evalúa si falla el primero
+            match1 = _RE_QUARTER_MONTHS.match(quarter_str)
+            match2 = None if match1 else _RE_QUARTER_V.match(quarter_str)
             
             if match1:
                 year = int(match1.group(1))
@@ -161,12 +190,7 @@ class LosRiosDataTransformer(DataTransformer):
                 month_num = month_map.get(start_month, 1)
                 quarter = (month_num - 1) // 3 + 1
                 
-                return {
-                    'year': year,
-                    'quarter': quarter,
-                    'month_start': month_num,
-                    'date_approx': f"{year}-{month_num:02d}-01"
-                }
+                return year, quarter, month_num, f"{year}-{month_num:02d}-01"
             
             elif match2:
                 year = int(match2.group(1))
@@ -176,30 +200,15 @@ class LosRiosDataTransformer(DataTransformer):
                 quarter = ((quarter_num - 1) // 3) + 1
                 month_start = ((quarter_num - 1) % 12) + 1
                 
-                return {
-                    'year': year,
-                    'quarter': quarter,
-                    'month_start': month_start,
-                    'date_approx': f"{year}-{month_start:02d}-01"
-                }
+                return year, quarter, month_start, f"{year}-{month_start:02d}-01"
             
             else:
                 logger.warning(f"Formato de trimestre no reconocido: {quarter_str}")
-                return {
-                    'year': None,
-                    'quarter': None,
-                    'month_start': None,
-                    'date_approx': None
-                }
+                return None, None, None, None
         
         except Exception as e:
             logger.error(f"Error procesando trimestre {quarter_str}: {e}")
-            return {
-                'year': None,
-                'quarter': None, 
-                'month_start': None,
-                'date_approx': None
-            }
+            return None, None, None, None
     
     def _transform_temporal_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -217,21 +226,25 @@ class LosRiosDataTransformer(DataTransformer):
         # Procesar información temporal
         logger.info("Procesando información temporal...")
         
-        temporal_info = df_temporal[DATA_COLUMNS.PROCESSED_DATE].apply(
-            self._parse_quarter_to_date
-        )
+        # Parsear solo los trimestres distintos (baja cardinalidad) y
+        # propagar los resultados a todas las filas con map
+        quarter_col = df_temporal[DATA_COLUMNS.PROCESSED_DATE]
+        parsed = {
+            quarter_str: self._parse_quarter_to_date(quarter_str)
+            for quarter_str in quarter_col.unique()
+        }
         
         # Extraer información en columnas separadas
-        df_temporal[DATA_COLUMNS.PROCESSED_YEAR] = temporal_info.apply(
-            lambda x: x['year']
+        df_temporal[DATA_COLUMNS.PROCESSED_YEAR] = quarter_col.map(
+            {q: info['year'] for q, info in parsed.items()}
         )
-        df_temporal[DATA_COLUMNS.PROCESSED_QUARTER] = temporal_info.apply(
-            lambda x: x['quarter']
+        df_temporal[DATA_COLUMNS.PROCESSED_QUARTER] = quarter_col.map(
+            {q: info['quarter'] for q, info in parsed.items()}
         )
         
         # Crear columna de fecha aproximada
-        df_temporal['fecha_completa'] = temporal_info.apply(
-            lambda x: x['date_approx']
+        df_temporal['fecha_completa'] = quarter_col.map(
+            {q: info['date_approx'] for q, info in parsed.items()}
         )
         
         # Convertir a datetime si es posible
@@ -242,6 +255,15 @@ class LosRiosDataTransformer(DataTransformer):
         except:
             logger.warning("No se pudo convertir fechas a datetime")
         
+        # Reducir tipos: el año cabe en int16 y el trimestre en int8
+        # (tipos nullable para conservar los trimestres no reconocidos)
+        df_temporal[DATA_COLUMNS.PROCESSED_YEAR] = (
+            df_temporal[DATA_COLUMNS.PROCESSED_YEAR].astype('Int16')
+        )
+        df_temporal[DATA_COLUMNS.PROCESSED_QUARTER] = (
+            df_temporal[DATA_COLUMNS.PROCESSED_QUARTER].astype('Int8')
+        )
+        
         logger.info("Información temporal procesada")
         return df_temporal
     
@@ -283,31 +305,39 @@ class LosRiosDataTransformer(DataTransformer):
         df_clean = df.copy()
         workforce_col = DATA_COLUMNS.PROCESSED_WORKFORCE
         
-        # Convertir a numérico
-        df_clean[workforce_col] = pd.to_numeric(
+        # Convertir a numérico (float32 basta para conteos de personas)
+        values = pd.to_numeric(
             df_clean[workforce_col], 
-            errors='coerce'
-        )
+            errors='coerce',
+            downcast='float'
+        ).to_numpy(copy=True)
         
         # Identificar valores problemáticos
-        null_values = df_clean[workforce_col].isnull().sum()
+        null_values = int(np.isnan(values).sum())
         if null_values > 0:
             logger.warning(f"Se encontraron {null_values} valores nulos en fuerza de trabajo")
         
         # Verificar valores negativos
-        negative_values = (df_clean[workforce_col] < 0).sum()
+        negative_values = int(np.count_nonzero(values < 0))
         if negative_values > 0:
             logger.warning(f"Se encontraron {negative_values} valores negativos")
-            # Convertir negativos a 0
-            df_clean.loc[df_clean[workforce_col] < 0, workforce_col] = 0
+            # Convertir negativos a 0 en una sola pasada (NaN se conserva)
+            np.maximum(values, 0, out=values)
+        
+        df_clean[workforce_col] = values
         
         # Verificar valores muy altos (outliers extremos)
-        if not df_clean[workforce_col].empty:
-            mean_val = df_clean[workforce_col].mean()
-            std_val = df_clean[workforce_col].std()
+        if values.size - null_values > 1:
+            # Reducciones directas sobre el arreglo (sin NaN basta mean/std)
+            if null_values > 0:
+                mean_val = np.nanmean(values, dtype=np.float64)
+                std_val = np.nanstd(values, dtype=np.float64, ddof=1)
+            else:
+                mean_val = values.mean(dtype=np.float64)
+                std_val = values.std(dtype=np.float64, ddof=1)
             threshold = mean_val + (5 * std_val)  # 5 desviaciones estándar
             
-            extreme_values = (df_clean[workforce_col] > threshold).sum()
+            extreme_values = int(np.count_nonzero(values > threshold))
             if extreme_values > 0:
                 logger.warning(f"Se encontraron {extreme_values} valores extremadamente altos")
         
@@ -327,15 +357,20 @@ class LosRiosDataTransformer(DataTransformer):
         """
         df_derived = df.copy()
         
-        # Agregar información de región
-        df_derived['region_codigo'] = self.region_code
-        df_derived['region_nombre'] = self.region_name
+        # Agregar información de región (valor constante: categórico)
+        df_derived['region_codigo'] = pd.Categorical(
+            [self.region_code] * len(df_derived)
+        )
+        df_derived['region_nombre'] = pd.Categorical(
+            [self.region_name] * len(df_derived)
+        )
         
         # Agregar período académico/fiscal si corresponde
         if DATA_COLUMNS.PROCESSED_YEAR in df_derived.columns:
-            df_derived['periodo_fiscal'] = df_derived[DATA_COLUMNS.PROCESSED_YEAR].apply(
-                lambda x: f"FY{x}" if x else None
-            )
+            year = df_derived[DATA_COLUMNS.PROCESSED_YEAR]
+            df_derived['periodo_fiscal'] = (
+                "FY" + year.astype('string')
+            ).where(year.notna(), None)
         
         # Agregar indicador de temporada (alta/baja según trimestre)
         if DATA_COLUMNS.PROCESSED_QUARTER in df_derived.columns:
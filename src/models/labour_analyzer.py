@@ -5,8 +5,11 @@ Clean Code: Single Responsibility - análisis específico del mercado laboral
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import logging
 
 from ...config import LosRiosConfig, AnalysisConfig
@@ -15,6 +18,10 @@ from ..utils.validators import DataValidator
 from ..utils.helpers import HelperFunctions
 
 
+# Columnas del análisis convertidas una sola vez a arrays (structure of arrays)
+LabourArrays = namedtuple('LabourArrays', ['total', 'male', 'female', 'period'])
+
+
 class LabourAnalyzer:
     """
     Analizador especializado del mercado laboral de Los Ríos.
@@ -65,24 +72,42 @@ class LabourAnalyzer:
             # Filtrar datos de Los Ríos
             los_rios_data = self._filter_los_rios_data(data)
             
+            labour_arrays = self._build_labour_arrays(los_rios_data)
+            
+            # Una sola marca de tiempo compartida por metadatos y resumen
+            analysis_ts = datetime.now()
+            
             perf_logger.checkpoint("data_preparation")
             
-            # Análisis principales
-            results = {
-                "metadata": self._create_analysis_metadata(los_rios_data),
-                "current_indicators": self._calculate_current_indicators(los_rios_data),
-                "historical_trends": self._analyze_historical_trends(los_rios_data),
-                "gender_analysis": self._analyze_gender_differences(los_rios_data),
-                "seasonal_patterns": self._analyze_seasonal_patterns(los_rios_data),
-                "growth_analysis": self._analyze_growth_patterns(los_rios_data),
-                "comparisons": self._create_comparative_analysis(los_rios_data),
-                "forecasts": self._create_basic_forecasts(los_rios_data)
+            # Análisis principales (independientes y de solo lectura: se
+            # ejecutan en paralelo, los kernels de pandas/numpy liberan el GIL)
+            analyses = {
+                "metadata": partial(self._create_analysis_metadata, analysis_ts=analysis_ts),
+                "current_indicators": self._calculate_current_indicators,
+                "historical_trends": partial(
+                    self._analyze_historical_trends, arrays=labour_arrays
+                ),
+                "gender_analysis": partial(
+                    self._analyze_gender_differences, arrays=labour_arrays
+                ),
+                "seasonal_patterns": self._analyze_seasonal_patterns,
+                "growth_analysis": self._analyze_growth_patterns,
+                "comparisons": self._create_comparative_analysis,
+                "forecasts": partial(self._create_basic_forecasts, arrays=labour_arrays)
             }
+            with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+                futures = {
+                    key: executor.submit(analysis, los_rios_data)
+                    for key, analysis in analyses.items()
+                }
+                results = {key: future.result() for key, future in futures.items()}
             
             perf_logger.checkpoint("analysis_complete")
             
             # Generar resumen ejecutivo
-            results["executive_summary"] = self._create_executive_summary(results)
+            results["executive_summary"] = self._create_executive_summary(
+                results, analysis_ts=analysis_ts
+            )
             
             elapsed_time = perf_logger.end(f"Analizados {len(los_rios_data)} registros")
             results["metadata"]["analysis_time_seconds"] = elapsed_time
@@ -97,21 +122,68 @@ class LabourAnalyzer:
     def _filter_los_rios_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """Filtra y prepara datos específicos de Los Ríos."""
         if 'region' in data.columns:
-            los_rios_data = data[data['region'] == self.config.REGION_CODE].copy()
+            los_rios_data = data.loc[data['region'] == self.config.REGION_CODE]
         else:
-            los_rios_data = data.copy()
+            los_rios_data = data
         
-        # Ordenar por período
+        # Ordenar por período: sort_values ya entrega un DataFrame nuevo,
+        # así que solo se copia explícitamente cuando no hay orden que aplicar
         if 'ano_trimestre' in los_rios_data.columns:
-            los_rios_data = los_rios_data.sort_values('ano_trimestre')
+            los_rios_data = los_rios_data.sort_values('ano_trimestre', ignore_index=True)
+        else:
+            los_rios_data = los_rios_data.copy()
+        
+        # Períodos como categórico ordenado: los agrupamientos usan códigos
+        # enteros y min/max siguen el orden lexicográfico del texto
+        if ('ano_trimestre' in los_rios_data.columns and
+                not isinstance(los_rios_data['ano_trimestre'].dtype, pd.CategoricalDtype)):
+            los_rios_data['ano_trimestre'] = pd.Categorical(
+                los_rios_data['ano_trimestre'], ordered=True
+            )
+        
+        # Reducir tipos enteros (int64 -> int32) para abaratar los recorridos;
+        # no se baja de int32 para que las sumas entre columnas no desborden
+        int32_info = np.iinfo(np.int32)
+        for column in ('fuerza_de_trabajo', 'hombres', 'mujeres'):
+            if column not in los_rios_data.columns:
+                continue
+            values = los_rios_data[column]
+            if values.dtype == np.int64:
+                target = np.int32
+            elif isinstance(values.dtype, pd.Int64Dtype):
+                target = 'Int32'
+            else:
+                continue
+            if values.between(int32_info.min, int32_info.max).all():
+                los_rios_data[column] = values.astype(target)
         
         self.logger.info(f"Datos filtrados: {len(los_rios_data)} registros de Los Ríos")
         return los_rios_data
     
-    def _create_analysis_metadata(self, data: pd.DataFrame) -> Dict[str, Any]:
+    @staticmethod
+    def _build_labour_arrays(data: pd.DataFrame) -> LabourArrays:
+        """Convierte una sola vez las columnas del análisis a arrays NumPy."""
+        def column_array(column: str, dtype: Any = np.float64) -> Optional[np.ndarray]:
+            if column not in data.columns:
+                return None
+            if dtype is None:
+                return data[column].to_numpy()
+            return data[column].to_numpy(dtype=dtype, na_value=np.nan)
+        
+        return LabourArrays(
+            total=column_array('fuerza_de_trabajo'),
+            male=column_array('hombres'),
+            female=column_array('mujeres'),
+            period=column_array('ano_trimestre', dtype=None)
+        )
+    
+    def _create_analysis_metadata(
+        self, data: pd.DataFrame, analysis_ts: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """Crea metadatos del análisis."""
+        analysis_ts = analysis_ts or datetime.now()
         return {
-            "analysis_date": datetime.now().isoformat(),
+            "analysis_date": analysis_ts.isoformat(timespec='seconds'),
             "region": self.config.REGION_NAME,
             "region_code": self.config.REGION_CODE,
             "total_records": len(data),
@@ -128,17 +200,20 @@ class LabourAnalyzer:
             if data.empty:
                 return {"error": "No hay datos disponibles"}
             
-            # Obtener último período
-            latest_data = data.iloc[-1] if len(data) > 0 else None
+            # Obtener último período leyendo escalares por columna, sin
+            # materializar la fila completa como Series de tipo object
+            last_idx = len(data) - 1
             
-            if latest_data is None:
-                return {"error": "No se pudo obtener datos del último período"}
+            def latest_value(column: str, default: Any) -> Any:
+                if column not in data.columns:
+                    return default
+                return data[column].iat[last_idx]
             
             indicators = {
-                "latest_period": latest_data.get('ano_trimestre', 'N/A'),
-                "total_labour_force": latest_data.get('fuerza_de_trabajo', 0),
-                "male_labour_force": latest_data.get('hombres', 0),
-                "female_labour_force": latest_data.get('mujeres', 0)
+                "latest_period": latest_value('ano_trimestre', 'N/A'),
+                "total_labour_force": latest_value('fuerza_de_trabajo', 0),
+                "male_labour_force": latest_value('hombres', 0),
+                "female_labour_force": latest_value('mujeres', 0)
             }
             
             # Calcular participación por género
@@ -166,12 +241,15 @@ class LabourAnalyzer:
             self.logger.error(f"Error calculando indicadores actuales: {str(e)}")
             return {"error": str(e)}
     
-    def _analyze_historical_trends(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_historical_trends(
+        self, data: pd.DataFrame, arrays: Optional[LabourArrays] = None
+    ) -> Dict[str, Any]:
         """Analiza tendencias históricas."""
         try:
             if len(data) < 2:
                 return {"error": "Insuficientes datos para análisis de tendencias"}
             
+            arrays = arrays or self._build_labour_arrays(data)
             trends = {}
             
             # Analizar fuerza de trabajo total
@@ -179,19 +257,19 @@ class LabourAnalyzer:
                 total_ft = data['fuerza_de_trabajo']
                 trends["total_labour_force"] = {
                     "growth_rates": self.helpers.calculate_growth_rates(total_ft),
-                    "trend_direction": self._determine_trend_direction(total_ft),
-                    "volatility": self._calculate_volatility(total_ft),
+                    "trend_direction": self._determine_trend_direction(arrays.total),
+                    "volatility": self._calculate_volatility(arrays.total),
                     "outliers": self.helpers.detect_outliers(total_ft).sum()
                 }
             
             # Analizar por género
             for gender, column in [("male", "hombres"), ("female", "mujeres")]:
                 if column in data.columns:
-                    gender_data = data[column]
+                    gender_values = getattr(arrays, gender)
                     trends[f"{gender}_labour_force"] = {
-                        "growth_rates": self.helpers.calculate_growth_rates(gender_data),
-                        "trend_direction": self._determine_trend_direction(gender_data),
-                        "volatility": self._calculate_volatility(gender_data)
+                        "growth_rates": self.helpers.calculate_growth_rates(data[column]),
+                        "trend_direction": self._determine_trend_direction(gender_values),
+                        "volatility": self._calculate_volatility(gender_values)
                     }
             
             return trends
@@ -200,30 +278,38 @@ class LabourAnalyzer:
             self.logger.error(f"Error en análisis de tendencias: {str(e)}")
             return {"error": str(e)}
     
-    def _analyze_gender_differences(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_gender_differences(
+        self, data: pd.DataFrame, arrays: Optional[LabourArrays] = None
+    ) -> Dict[str, Any]:
         """Analiza diferencias de género en el mercado laboral."""
         try:
             if not all(col in data.columns for col in ['hombres', 'mujeres']):
                 return {"error": "Datos de género no disponibles"}
             
+            arrays = arrays or self._build_labour_arrays(data)
             male_data = data['hombres']
             female_data = data['mujeres']
             
+            # Promedios de ambos géneros en una sola agregación reutilizada
+            averages = data[['hombres', 'mujeres']].mean()
+            male_mean = averages['hombres']
+            female_mean = averages['mujeres']
+            
             analysis = {
                 "average_participation": {
-                    "male": round(male_data.mean(), 0),
-                    "female": round(female_data.mean(), 0)
+                    "male": round(male_mean, 0),
+                    "female": round(female_mean, 0)
                 },
                 "participation_ratio": round(
-                    self.helpers.safe_divide(male_data.mean(), female_data.mean(), 1.0), 2
+                    self.helpers.safe_divide(male_mean, female_mean, 1.0), 2
                 ),
                 "growth_comparison": {
                     "male": self.helpers.calculate_growth_rates(male_data),
                     "female": self.helpers.calculate_growth_rates(female_data)
                 },
                 "volatility_comparison": {
-                    "male": self._calculate_volatility(male_data),
-                    "female": self._calculate_volatility(female_data)
+                    "male": self._calculate_volatility(arrays.male),
+                    "female": self._calculate_volatility(arrays.female)
                 }
             }
             
@@ -246,19 +332,18 @@ class LabourAnalyzer:
             if 'ano_trimestre' not in data.columns or len(data) < 8:
                 return {"error": "Insuficientes datos para análisis estacional"}
             
-            # Extraer trimestres
-            data_with_quarters = data.copy()
-            data_with_quarters['quarter'] = data_with_quarters['ano_trimestre'].apply(
-                lambda x: self.helpers.parse_ine_period(x)[1] if isinstance(x, str) else 'Q1'
-            )
+            quarter_labels = ['Q1', 'Q2', 'Q3', 'Q4']
+            quarter_codes = self._period_quarter_codes(data['ano_trimestre'], quarter_labels)
             
             seasonal_analysis = {}
             
             # Análisis por trimestre
             if 'fuerza_de_trabajo' in data.columns:
-                quarterly_stats = data_with_quarters.groupby('quarter')['fuerza_de_trabajo'].agg([
-                    'mean', 'std', 'count'
-                ]).round(0)
+                quarterly_stats = self._aggregate_by_quarter(
+                    quarter_codes,
+                    data['fuerza_de_trabajo'].to_numpy(dtype=np.float64, na_value=np.nan),
+                    quarter_labels
+                ).round(0)
                 
                 seasonal_analysis["quarterly_patterns"] = quarterly_stats.to_dict()
                 
@@ -276,6 +361,62 @@ class LabourAnalyzer:
             self.logger.error(f"Error en análisis estacional: {str(e)}")
             return {"error": str(e)}
     
+    @staticmethod
+    def _period_quarter_codes(periods: pd.Series, quarter_labels: List[str]) -> np.ndarray:
+        """
+        Obtiene el código de trimestre (0..3) de cada período.
+        
+        El texto se procesa solo sobre las categorías únicas: sufijo "Qn"
+        directo o período del INE ("2024-MAR") vía parse_ine_periods; luego
+        se expande a todas las filas mediante los códigos del categórico.
+        """
+        if not isinstance(periods.dtype, pd.CategoricalDtype):
+            periods = periods.astype('category')
+        
+        categories = pd.Series(periods.cat.categories).astype('string')
+        suffix = categories.str.split('-', n=1).str[1].str.upper()
+        quarters = suffix.where(
+            suffix.isin(quarter_labels),
+            HelperFunctions.parse_ine_periods(categories)['quarter']
+        ).fillna('Q1')
+        
+        # Código extra al final: los períodos nulos (código -1) caen en Q1
+        lookup = np.append(pd.Categorical(quarters, categories=quarter_labels).codes, 0)
+        return lookup[periods.cat.codes.to_numpy()]
+    
+    @staticmethod
+    def _aggregate_by_quarter(codes: np.ndarray, values: np.ndarray,
+                              labels: List[str]) -> pd.DataFrame:
+        """
+        Calcula media, desviación estándar (ddof=1) y conteo por trimestre.
+        
+        Con solo cuatro claves fijas, np.bincount sobre los códigos evita
+        el costo de hashing y agrupamiento de groupby.
+        """
+        n_groups = len(labels)
+        observed = np.bincount(codes, minlength=n_groups) > 0
+        
+        valid = ~np.isnan(values)
+        valid_codes = codes[valid]
+        valid_values = values[valid]
+        
+        counts = np.bincount(valid_codes, minlength=n_groups)
+        sums = np.bincount(valid_codes, weights=valid_values, minlength=n_groups)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+            squared_dev = np.bincount(
+                valid_codes,
+                weights=(valid_values - means[valid_codes]) ** 2,
+                minlength=n_groups
+            )
+            stds = np.where(counts > 1, np.sqrt(squared_dev / (counts - 1)), np.nan)
+        
+        return pd.DataFrame(
+            {'mean': means[observed], 'std': stds[observed], 'count': counts[observed]},
+            index=pd.Index(np.asarray(labels)[observed], name='quarter')
+        )
+    
     def _analyze_growth_patterns(self, data: pd.DataFrame) -> Dict[str, Any]:
         """Analiza patrones de crecimiento detallados."""
         try:
@@ -287,14 +428,17 @@ class LabourAnalyzer:
                 data, 'fuerza_de_trabajo'
             )
             
+            diffs = growth_data['fuerza_de_trabajo_diff']
+            diff_values = diffs.to_numpy(dtype=np.float64)
+            
             patterns = {
                 "period_to_period": {
-                    "average_change": round(growth_data['fuerza_de_trabajo_diff'].mean(), 0),
+                    "average_change": round(diffs.mean(), 0),
                     "average_pct_change": round(growth_data['fuerza_de_trabajo_pct_change'].mean(), 2),
-                    "max_increase": round(growth_data['fuerza_de_trabajo_diff'].max(), 0),
-                    "max_decrease": round(growth_data['fuerza_de_trabajo_diff'].min(), 0),
-                    "positive_periods": (growth_data['fuerza_de_trabajo_diff'] > 0).sum(),
-                    "negative_periods": (growth_data['fuerza_de_trabajo_diff'] < 0).sum()
+                    "max_increase": round(diffs.max(), 0),
+                    "max_decrease": round(diffs.min(), 0),
+                    "positive_periods": np.count_nonzero(diff_values > 0),
+                    "negative_periods": np.count_nonzero(diff_values < 0)
                 }
             }
             
@@ -302,12 +446,13 @@ class LabourAnalyzer:
             if 'fuerza_de_trabajo_yoy_change' in growth_data.columns:
                 yoy_data = growth_data['fuerza_de_trabajo_yoy_change'].dropna()
                 if len(yoy_data) > 0:
+                    yoy_values = yoy_data.to_numpy(dtype=np.float64)
                     patterns["year_over_year"] = {
                         "average_yoy_change": round(yoy_data.mean(), 2),
                         "max_yoy_increase": round(yoy_data.max(), 2),
                         "max_yoy_decrease": round(yoy_data.min(), 2),
-                        "positive_years": (yoy_data > 0).sum(),
-                        "negative_years": (yoy_data < 0).sum()
+                        "positive_years": np.count_nonzero(yoy_values > 0),
+                        "negative_years": np.count_nonzero(yoy_values < 0)
                     }
             
             return patterns
@@ -350,23 +495,27 @@ class LabourAnalyzer:
             self.logger.error(f"Error en análisis comparativo: {str(e)}")
             return {"error": str(e)}
     
-    def _create_basic_forecasts(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _create_basic_forecasts(
+        self, data: pd.DataFrame, arrays: Optional[LabourArrays] = None
+    ) -> Dict[str, Any]:
         """Crea proyecciones básicas."""
         try:
             if 'fuerza_de_trabajo' not in data.columns or len(data) < 4:
                 return {"error": "Insuficientes datos para proyecciones"}
             
+            arrays = arrays or self._build_labour_arrays(data)
+            
             # Calcular tendencia simple usando últimos períodos
-            recent_data = data.tail(4)  # Últimos 4 trimestres
-            recent_values = recent_data['fuerza_de_trabajo'].values
+            recent_values = arrays.total[-4:]  # Últimos 4 trimestres
             
             # Tendencia lineal simple
-            x = np.arange(len(recent_values))
-            coeffs = np.polyfit(x, recent_values, 1)
-            trend_slope = coeffs[0]
+            trend_slope = self._linear_slope(recent_values)
+            finite_values = recent_values[np.isfinite(recent_values)]
+            if not np.isfinite(trend_slope):
+                return {"error": "Insuficientes datos para proyecciones"}
             
-            # Proyección para próximos 2 trimestres
-            last_value = recent_values[-1]
+            # Proyección para próximos 2 trimestres (desde el último valor válido)
+            last_value = finite_values[-1]
             forecast_1q = last_value + trend_slope
             forecast_2q = last_value + (2 * trend_slope)
             
@@ -387,12 +536,15 @@ class LabourAnalyzer:
             self.logger.error(f"Error en proyecciones: {str(e)}")
             return {"error": str(e)}
     
-    def _create_executive_summary(self, results: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_executive_summary(
+        self, results: Dict[str, Any], analysis_ts: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """Crea resumen ejecutivo del análisis."""
         try:
+            analysis_ts = analysis_ts or datetime.now()
             summary = {
                 "region": self.config.REGION_NAME,
-                "analysis_date": datetime.now().strftime("%Y-%m-%d"),
+                "analysis_date": analysis_ts.strftime("%Y-%m-%d"),
                 "key_findings": [],
                 "recommendations": [],
                 "data_period": results.get("metadata", {}).get("period_range", {})
@@ -453,32 +605,66 @@ class LabourAnalyzer:
             self.logger.error(f"Error creando resumen ejecutivo: {str(e)}")
             return {"error": str(e)}
     
-    def _determine_trend_direction(self, series: pd.Series) -> str:
+    def _determine_trend_direction(self, series: Union[pd.Series, np.ndarray]) -> str:
         """Determina la dirección general de una tendencia."""
-        if len(series) < 2:
+        values = np.asarray(series, dtype=np.float64)
+        if values.size < 2:
             return "insufficient_data"
         
         # Calcular pendiente de tendencia lineal
-        x = np.arange(len(series))
-        coeffs = np.polyfit(x, series.values, 1)
-        slope = coeffs[0]
+        slope = self._linear_slope(values)
+        if not np.isfinite(slope):
+            return "insufficient_data"
         
-        if abs(slope) < series.mean() * 0.01:  # Cambio menor al 1% promedio
+        if abs(slope) < np.nanmean(values) * 0.01:  # Cambio menor al 1% promedio
             return "stable"
         elif slope > 0:
             return "increasing"
         else:
             return "decreasing"
     
-    def _calculate_volatility(self, series: pd.Series) -> Dict[str, float]:
+    @staticmethod
+    def _linear_slope(values: np.ndarray) -> float:
+        """
+        Pendiente de mínimos cuadrados sobre x = 0..n-1 (forma cerrada).
+        
+        Los puntos no finitos se descartan conservando su posición en x;
+        con menos de dos puntos válidos la pendiente es NaN.
+        """
+        n = values.size
+        finite = np.isfinite(values)
+        if finite.all():
+            x_centered = np.arange(n) - (n - 1) / 2
+            # sum((x - x_mean)^2) = n(n^2 - 1)/12 para x = 0..n-1
+            return float((x_centered * (values - values.mean())).sum() / (n * (n * n - 1) / 12))
+        
+        if np.count_nonzero(finite) < 2:
+            return np.nan
+        x = np.flatnonzero(finite).astype(np.float64)
+        y = values[finite]
+        x_centered = x - x.mean()
+        return float((x_centered * (y - y.mean())).sum() / (x_centered * x_centered).sum())
+    
+    def _calculate_volatility(self, series: Union[pd.Series, np.ndarray]) -> Dict[str, float]:
         """Calcula métricas de volatilidad."""
         try:
-            pct_changes = series.pct_change().dropna()
+            # Un solo buffer NumPy: las variaciones salen de a[1:] / a[:-1]
+            # sin materializar pct_change, dropna ni abs como Series
+            values = np.asarray(series, dtype=np.float64)
+            values = values[~np.isnan(values)]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                abs_changes = np.abs(values[1:] / values[:-1] - 1.0)
+            
+            if abs_changes.size:
+                average_change = abs_changes.mean()
+                max_change = abs_changes.max()
+            else:
+                average_change = max_change = np.nan
             
             return {
-                "coefficient_of_variation": round((series.std() / series.mean()) * 100, 2),
-                "average_absolute_change": round(pct_changes.abs().mean() * 100, 2),
-                "max_change": round(pct_changes.abs().max() * 100, 2)
+                "coefficient_of_variation": round((values.std(ddof=1) / values.mean()) * 100, 2),
+                "average_absolute_change": round(average_change * 100, 2),
+                "max_change": round(max_change * 100, 2)
             }
         except Exception:
             return {"error": "No se pudo calcular volatilidad"}
@@ -7,12 +7,47 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from scipy import stats
+from functools import lru_cache
 import logging
 
 from ...config import LosRiosConfig
 from ..utils.logger import setup_logger
 
 
+# Sobre este tamaño Shapiro-Wilk es lento y su p-valor deja de ser fiable
+_SHAPIRO_MAX_N = 5000
+
+
+@lru_cache(maxsize=32)
+def _index_array(n: int) -> np.ndarray:
+    """Eje x = 0..n-1 en float64, cacheado por tamaño (solo lectura)."""
+    x = np.arange(n, dtype=np.float64)
+    x.setflags(write=False)
+    return x
+
+
+def _mann_kendall_s(values: np.ndarray) -> int:
+    """
+    Calcula el estadístico S de Mann-Kendall a partir de la tau-b de scipy.
+    
+    kendalltau resuelve los pares concordantes/discordantes en O(n log n)
+    en C. Con x = 0..n-1 (sin empates) S = tau_b * sqrt(n0 * (n0 - n2)),
+    donde n2 son los pares empatados en los valores.
+    """
+    n = values.size
+    if n < 2:
+        return 0
+    
+    tau, _ = stats.kendalltau(_index_array(n), values)
+    if np.isnan(tau):
+        return 0
+    
+    n_pairs = n * (n - 1) / 2
+    _, tie_counts = np.unique(values, return_counts=True)
+    tied_pairs = (tie_counts * (tie_counts - 1) / 2).sum()
+    return int(round(tau * np.sqrt(n_pairs * (n_pairs - tied_pairs))))
+
+
 class StatisticsEngine:
     """
     Motor estadístico para análisis avanzados.
@@ -29,21 +64,35 @@ class StatisticsEngine:
         try:
             clean_data = data.dropna()
             
+            # Una sola conversión y reducciones reutilizadas en todo el resumen
+            values = clean_data.to_numpy(dtype=np.float64)
+            if values.size > 0:
+                mean = values.mean()
+                variance = values.var(ddof=1) if values.size > 1 else np.nan
+                min_value = values.min()
+                max_value = values.max()
+                q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+            else:
+                mean = variance = min_value = max_value = q1 = median = q3 = np.nan
+            
+            modes = clean_data.mode()
+            mode = modes.iloc[0] if len(modes) > 0 else mean
+            
             return {
-                "count": len(clean_data),
-                "mean": round(clean_data.mean(), 2),
-                "median": round(clean_data.median(), 2),
-                "mode": round(clean_data.mode().iloc[0] if len(clean_data.mode()) > 0 else clean_data.mean(), 2),
-                "std_dev": round(clean_data.std(), 2),
-                "variance": round(clean_data.var(), 2),
-                "skewness": round(stats.skew(clean_data), 2),
-                "kurtosis": round(stats.kurtosis(clean_data), 2),
-                "min": round(clean_data.min(), 2),
-                "max": round(clean_data.max(), 2),
-                "range": round(clean_data.max() - clean_data.min(), 2),
-                "q1": round(clean_data.quantile(0.25), 2),
-                "q3": round(clean_data.quantile(0.75), 2),
-                "iqr": round(clean_data.quantile(0.75) - clean_data.quantile(0.25), 2)
+                "count": values.size,
+                "mean": round(mean, 2),
+                "median": round(median, 2),
+                "mode": round(mode, 2),
+                "std_dev": round(np.sqrt(variance), 2),
+                "variance": round(variance, 2),
+                "skewness": round(stats.skew(values), 2),
+                "kurtosis": round(stats.kurtosis(values), 2),
+                "min": round(min_value, 2),
+                "max": round(max_value, 2),
+                "range": round(max_value - min_value, 2),
+                "q1": round(q1, 2),
+                "q3": round(q3, 2),
+                "iqr": round(q3 - q1, 2)
             }
         except Exception as e:
             self.logger.error(f"Error calculando estadísticas descriptivas: {str(e)}")
@@ -52,19 +101,16 @@ class StatisticsEngine:
     def perform_trend_analysis(self, data: pd.Series) -> Dict[str, Any]:
         """Realiza análisis de tendencias estadístico."""
         try:
-            clean_data = data.dropna()
-            x = np.arange(len(clean_data))
+            # Un único buffer contiguo float64 para la regresión y Mann-Kendall
+            values = np.ascontiguousarray(data.dropna().to_numpy(dtype=np.float64))
+            n = values.size
+            x = _index_array(n)
             
             # Regresión lineal
-            slope, intercept, r_value, p_value, std_err = stats.linregress(x, clean_data)
+            slope, intercept, r_value, p_value, std_err = stats.linregress(x, values)
             
             # Test de Mann-Kendall para tendencias
-            n = len(clean_data)
-            s_statistic = 0
-            
-            for i in range(n-1):
-                for j in range(i+1, n):
-                    s_statistic += np.sign(clean_data.iloc[j] - clean_data.iloc[i])
+            s_statistic = _mann_kendall_s(values)
             
             # Varianza de S
             var_s = n * (n - 1) * (2 * n + 5) / 18
@@ -104,20 +150,39 @@ class StatisticsEngine:
         """Detecta puntos de cambio en series temporales."""
         try:
             clean_data = data.dropna()
-            change_points = []
             
             # Implementación simple basada en diferencias de media
             n = len(clean_data)
+            split_points = np.arange(min_size, n - min_size)
+            if split_points.size == 0:
+                return []
             
-            for i in range(min_size, n - min_size):
-                before = clean_data.iloc[:i]
-                after = clean_data.iloc[i:]
-                
-                # Test t para diferencia de medias
-                t_stat, p_value = stats.ttest_ind(before, after)
-                
-                if p_value < 0.01:  # Punto de cambio significativo
-                    change_points.append(i)
+            # Sumas acumuladas (datos centrados para estabilidad numérica):
+            # cada división se evalúa en O(1) en lugar de re-escanear la serie
+            values = clean_data.to_numpy(dtype=np.float64)
+            values = values - values.mean()
+            cum_sum = np.cumsum(values)
+            cum_sq = np.cumsum(values * values)
+            
+            n_before = split_points.astype(np.float64)
+            n_after = n - n_before
+            sum_before = cum_sum[split_points - 1]
+            sum_after = cum_sum[-1] - sum_before
+            sq_before = cum_sq[split_points - 1]
+            sq_after = cum_sq[-1] - sq_before
+            
+            # Test t para diferencia de medias (varianza combinada, igual que ttest_ind)
+            ss_before = np.maximum(sq_before - sum_before**2 / n_before, 0.0)
+            ss_after = np.maximum(sq_after - sum_after**2 / n_after, 0.0)
+            pooled_var = (ss_before + ss_after) / (n - 2)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t_stat = (sum_before / n_before - sum_after / n_after) / np.sqrt(
+                    pooled_var * (1 / n_before + 1 / n_after)
+                )
+            p_values = 2 * stats.t.sf(np.abs(t_stat), n - 2)
+            
+            # Punto de cambio significativo
+            change_points = split_points[p_values < 0.01].tolist()
             
             return change_points
             
@@ -129,12 +194,27 @@ class StatisticsEngine:
         """Calcula matriz de correlaciones."""
         try:
             numeric_data = data.select_dtypes(include=[np.number])
+            values = numeric_data.to_numpy(dtype=np.float64, na_value=np.nan)
             
-            # Correlación de Pearson
-            pearson_corr = numeric_data.corr()
-            
-            # Correlación de Spearman
-            spearman_corr = numeric_data.corr(method='spearman')
+            if np.isnan(values).any():
+                # Con nulos se mantiene la correlación por pares de pandas
+                pearson_corr = numeric_data.corr()
+                spearman_corr = numeric_data.corr(method='spearman')
+            else:
+                columns = numeric_data.columns
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    # Correlación de Pearson
+                    pearson = np.corrcoef(values, rowvar=False)
+                    
+                    # Correlación de Spearman (rangos calculados una sola vez)
+                    spearman = np.corrcoef(stats.rankdata(values, axis=0), rowvar=False)
+                
+                pearson_corr = pd.DataFrame(
+                    np.atleast_2d(pearson), index=columns, columns=columns
+                )
+                spearman_corr = pd.DataFrame(
+                    np.atleast_2d(spearman), index=columns, columns=columns
+                )
             
             return {
                 "pearson": pearson_corr.to_dict(),
@@ -149,23 +229,31 @@ class StatisticsEngine:
     def perform_normality_tests(self, data: pd.Series) -> Dict[str, Any]:
         """Realiza tests de normalidad."""
         try:
-            clean_data = data.dropna()
+            # Ordenar una sola vez; los tres tests trabajan sobre la muestra ordenada
+            values = np.sort(data.dropna().to_numpy(dtype=np.float64))
             
-            # Shapiro-Wilk test
-            sw_stat, sw_p = stats.shapiro(clean_data)
+            # Shapiro-Wilk test (omitido en muestras grandes)
+            if values.size > _SHAPIRO_MAX_N:
+                shapiro_wilk = {
+                    "skipped": True,
+                    "reason": f"n > {_SHAPIRO_MAX_N}"
+                }
+            else:
+                sw_stat, sw_p = stats.shapiro(values)
+                shapiro_wilk = {
+                    "statistic": round(sw_stat, 4),
+                    "p_value": round(sw_p, 4),
+                    "is_normal": sw_p > 0.05
+                }
             
             # Kolmogorov-Smirnov test
-            ks_stat, ks_p = stats.kstest(clean_data, 'norm', args=(clean_data.mean(), clean_data.std()))
+            ks_stat, ks_p = stats.kstest(values, 'norm', args=(values.mean(), values.std(ddof=1)))
             
             # Anderson-Darling test
-            ad_stat, ad_critical, ad_significance = stats.anderson(clean_data, dist='norm')
+            ad_stat, ad_critical, ad_significance = stats.anderson(values, dist='norm')
             
             return {
-                "shapiro_wilk": {
-                    "statistic": round(sw_stat, 4),
-                    "p_value": round(sw_p, 4),
-                    "is_normal": sw_p > 0.05
-                },
+                "shapiro_wilk": shapiro_wilk,
                 "kolmogorov_smirnov": {
                     "statistic": round(ks_stat, 4),
                     "p_value": round(ks_p, 4),
@@ -184,26 +272,27 @@ class StatisticsEngine:
     
     def _find_strongest_correlations(self, corr_matrix: pd.DataFrame) -> List[Dict[str, Any]]:
         """Encuentra las correlaciones más fuertes."""
-        correlations = []
+        matrix = corr_matrix.to_numpy(dtype=np.float64)
+        rows, cols = np.triu_indices(matrix.shape[0], k=1)
+        values = matrix[rows, cols]
         
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i+1, len(corr_matrix.columns)):
-                var1 = corr_matrix.columns[i]
-                var2 = corr_matrix.columns[j]
-                correlation = corr_matrix.iloc[i, j]
-                
-                if not np.isnan(correlation):
-                    correlations.append({
-                        "variable_1": var1,
-                        "variable_2": var2,
-                        "correlation": round(correlation, 4),
-                        "strength": self._classify_correlation_strength(abs(correlation))
-                    })
+        # Descartar pares sin correlación definida
+        valid = ~np.isnan(values)
+        rows, cols, values = rows[valid], cols[valid], np.round(values[valid], 4)
         
-        # Ordenar por correlación absoluta
-        correlations.sort(key=lambda x: abs(x["correlation"]), reverse=True)
+        # Ordenar por correlación absoluta (estable ante empates) - Top 10
+        top = np.argsort(-np.abs(values), kind='stable')[:10]
+        names = corr_matrix.columns
         
-        return correlations[:10]  # Top 10
+        return [
+            {
+                "variable_1": names[rows[k]],
+                "variable_2": names[cols[k]],
+                "correlation": values[k],
+                "strength": self._classify_correlation_strength(abs(values[k]))
+            }
+            for k in top
+        ]
     
     def _classify_correlation_strength(self, abs_correlation: float) -> str:
         """Clasifica la fuerza de una correlación."""
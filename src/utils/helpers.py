@@ -7,12 +7,40 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Union, Tuple
 from datetime import datetime, timedelta
+import math
 import re
+import stat
+import unicodedata
+import warnings
 from pathlib import Path
 
 from ...config import LosRiosConfig
 
 
+# Mapeo de meses del INE (abreviatura en español) a trimestres
+MONTH_TO_QUARTER = {
+    'ENE': 'Q1', 'FEB': 'Q1', 'MAR': 'Q1',
+    'ABR': 'Q2', 'MAY': 'Q2', 'JUN': 'Q2',
+    'JUL': 'Q3', 'AGO': 'Q3', 'SEP': 'Q3',
+    'OCT': 'Q4', 'NOV': 'Q4', 'DIC': 'Q4'
+}
+
+# Marcas combinantes de los bloques diacríticos Unicode: tras la
+# descomposición NFKD eliminarlas quita cualquier acento (á, ü, ç, ô, ñ...)
+_RE_COMBINING = re.compile('[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]')
+
+# Expresiones de limpieza de texto compiladas una sola vez
+_RE_NONWORD = re.compile(r'[^\w\s-]')
+_RE_WS = re.compile(r'\s+')
+
+# Sufijos y divisores por orden de magnitud (miles) para formatear números
+_MAGNITUDE_SUFFIXES = ('', 'K', 'M', 'B')
+_MAGNITUDE_DIVISORS = (1, 1_000, 1_000_000, 1_000_000_000)
+
+# Sobre esta cardinalidad no se calculan los valores más frecuentes
+_MAX_CATEGORICAL_CARDINALITY = 10_000
+
+
 class HelperFunctions:
     """
     Conjunto de funciones auxiliares para el análisis de Los Ríos.
@@ -51,19 +79,44 @@ class HelperFunctions:
             month_str = parts[1].upper()
             
             # Mapear meses a trimestres
-            month_to_quarter = {
-                'ENE': 'Q1', 'FEB': 'Q1', 'MAR': 'Q1',
-                'ABR': 'Q2', 'MAY': 'Q2', 'JUN': 'Q2',
-                'JUL': 'Q3', 'AGO': 'Q3', 'SEP': 'Q3',
-                'OCT': 'Q4', 'NOV': 'Q4', 'DIC': 'Q4'
-            }
-            
-            quarter = month_to_quarter.get(month_str, 'Q1')
+            quarter = MONTH_TO_QUARTER.get(month_str, 'Q1')
             return year, quarter
             
         except Exception as e:
             raise ValueError(f"Error parseando período {period_str}: {str(e)}")
     
+    @staticmethod
+    def parse_ine_periods(periods: pd.Series) -> pd.DataFrame:
+        """
+        Versión vectorizada de parse_ine_period para series completas.
+        
+        Args:
+            periods: Serie de períodos del INE (ej: "2024-MAR")
+            
+        Returns:
+            DataFrame con columnas 'year' y 'quarter' (nulos si el formato es inválido)
+        """
+        # En paneles cada período se repite por región: se parsean solo los
+        # valores únicos y el resultado se expande con los códigos
+        codes, uniques = pd.factorize(periods)
+        
+        parts = (
+            pd.Series(uniques, dtype='string')
+            .str.split('-', n=1, expand=True)
+            .reindex(columns=[0, 1])
+            .astype('string')
+        )
+        month = parts[1].str.upper()
+        # Igual que la versión escalar: exactamente "AÑO-MES" con año numérico
+        year = pd.to_numeric(parts[0].where(~month.str.contains('-', na=True)), errors='coerce')
+        quarter = month.map(MONTH_TO_QUARTER).fillna('Q1').where(year.notna())
+        
+        # allow_fill: el código -1 (período nulo) queda como <NA>
+        return pd.DataFrame({
+            'year': year.astype('Int16').array.take(codes, allow_fill=True),
+            'quarter': quarter.astype('string').array.take(codes, allow_fill=True)
+        }, index=periods.index)
+    
     @staticmethod
     def calculate_period_differences(df: pd.DataFrame, value_column: str) -> pd.DataFrame:
         """
@@ -76,23 +129,33 @@ class HelperFunctions:
         Returns:
             DataFrame con columnas adicionales de diferencias
         """
-        result_df = df.copy()
-        
-        # Ordenar por período
-        if 'ano_trimestre' in result_df.columns:
-            result_df = result_df.sort_values('ano_trimestre')
-        
-        # Calcular diferencias absolutas
-        result_df[f'{value_column}_diff'] = result_df[value_column].diff()
-        
-        # Calcular diferencias porcentuales
-        result_df[f'{value_column}_pct_change'] = result_df[value_column].pct_change() * 100
+        # Ordenar por período (sort_values ya devuelve un DataFrame nuevo)
+        if 'ano_trimestre' in df.columns:
+            df = df.sort_values('ano_trimestre', kind='stable')
+        
+        values = df[value_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        def lagged_change(lag: int) -> Tuple[np.ndarray, np.ndarray]:
+            diff = np.full(values.size, np.nan)
+            pct = np.full(values.size, np.nan)
+            diff[lag:] = values[lag:] - values[:-lag]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pct[lag:] = diff[lag:] / values[:-lag] * 100
+            return diff, pct
+        
+        # Diferencias absolutas y porcentuales período a período
+        diff, pct_change = lagged_change(1)
+        new_columns = {
+            f'{value_column}_diff': diff,
+            f'{value_column}_pct_change': pct_change
+        }
         
         # Calcular diferencias anuales (año sobre año)
-        if len(result_df) >= 4:  # Al menos 4 trimestres
-            result_df[f'{value_column}_yoy_change'] = result_df[value_column].pct_change(periods=4) * 100
+        if len(df) >= 4:  # Al menos 4 trimestres
+            new_columns[f'{value_column}_yoy_change'] = lagged_change(4)[1]
         
-        return result_df
+        # Una sola asignación para todas las columnas nuevas
+        return df.assign(**new_columns)
     
     @staticmethod
     def detect_outliers(series: pd.Series, method: str = "iqr") -> pd.Series:
@@ -107,22 +170,46 @@ class HelperFunctions:
             Serie booleana indicando outliers
         """
         if method == "iqr":
-            Q1 = series.quantile(0.25)
-            Q3 = series.quantile(0.75)
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            if values.size == 0:
+                return pd.Series(False, index=series.index, name=series.name)
+            
+            # Ambos cuartiles en una sola llamada sobre el ndarray
+            quantile = np.nanquantile if np.isnan(values).any() else np.quantile
+            Q1, Q3 = quantile(values, [0.25, 0.75])
             IQR = Q3 - Q1
             lower_bound = Q1 - 1.5 * IQR
             upper_bound = Q3 + 1.5 * IQR
-            return (series < lower_bound) | (series > upper_bound)
+            return pd.Series(
+                (values < lower_bound) | (values > upper_bound),
+                index=series.index, name=series.name
+            )
         
         elif method == "zscore":
-            z_scores = np.abs((series - series.mean()) / series.std())
-            return z_scores > 3
+            # Media y desviación estándar (ddof=1, omitiendo nulos) sobre un
+            # único buffer; las desviaciones centradas se reutilizan para el umbral
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            valid = ~np.isnan(values)
+            n_valid = np.count_nonzero(valid)
+            # Con menos de dos valores la desviación estándar no está definida
+            if n_valid < 2:
+                return pd.Series(False, index=series.index, name=series.name)
+            
+            centered = values - np.nansum(values) / n_valid
+            with np.errstate(divide='ignore', invalid='ignore'):
+                std = np.sqrt(np.sum(centered[valid] ** 2) / (n_valid - 1))
+                z_scores = np.abs(centered / std)
+            return pd.Series(z_scores > 3, index=series.index, name=series.name)
         
         elif method == "modified_zscore":
-            median = series.median()
-            mad = np.median(np.abs(series - median))
-            modified_z_scores = 0.6745 * (series - median) / mad
-            return np.abs(modified_z_scores) > 3.5
+            # Las desviaciones absolutas se calculan una vez y sirven para la
+            # MAD y para el umbral: |0.6745 * (x - mediana) / MAD| > 3.5
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            deviations = np.abs(values - series.median())
+            mad = np.median(deviations)
+            return pd.Series(
+                deviations * 0.6745 > 3.5 * mad, index=series.index, name=series.name
+            )
         
         else:
             raise ValueError(f"Método {method} no soportado")
@@ -136,25 +223,21 @@ class HelperFunctions:
             ages: Serie con edades
             
         Returns:
-            Serie con grupos etarios
-        """
-        def categorize_age(age):
-            if pd.isna(age):
-                return "No especificado"
-            elif age < 25:
-                return "15-24 años"
-            elif age < 35:
-                return "25-34 años"
-            elif age < 45:
-                return "35-44 años"
-            elif age < 55:
-                return "45-54 años"
-            elif age < 65:
-                return "55-64 años"
-            else:
-                return "65+ años"
-        
-        return ages.apply(categorize_age)
+            Serie categórica con grupos etarios
+        """
+        # Bucketing vectorizado (searchsorted) en lugar de apply por fila
+        labels = [
+            "15-24 años", "25-34 años", "35-44 años",
+            "45-54 años", "55-64 años", "65+ años"
+        ]
+        age_groups = pd.cut(
+            ages,
+            bins=[-np.inf, 25, 35, 45, 55, 65, np.inf],
+            labels=labels,
+            right=False
+        )
+        
+        return age_groups.cat.add_categories(["No especificado"]).fillna("No especificado")
     
     @staticmethod
     def standardize_text(text: str) -> str:
@@ -170,23 +253,40 @@ class HelperFunctions:
         if not isinstance(text, str):
             return str(text)
         
-        # Remover acentos
-        replacements = {
-            'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
-            'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
-            'ñ': 'n', 'Ñ': 'N'
-        }
-        
-        for original, replacement in replacements.items():
-            text = text.replace(original, replacement)
+        # Remover acentos (los textos ASCII no requieren normalización)
+        if not text.isascii():
+            text = _RE_COMBINING.sub('', unicodedata.normalize('NFKD', text))
         
         # Limpiar espacios y caracteres especiales
-        text = re.sub(r'[^\w\s-]', '', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_NONWORD.sub('', text)
+        text = _RE_WS.sub(' ', text)
         text = text.strip()
         
         return text
     
+    @staticmethod
+    def standardize_series(series: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de standardize_text para columnas completas.
+        
+        Args:
+            series: Serie de textos a estandarizar
+            
+        Returns:
+            Serie con textos estandarizados
+        """
+        # Columnas con valores no textuales conservan la semántica escalar
+        if not pd.api.types.is_string_dtype(series):
+            return series.map(HelperFunctions.standardize_text)
+        
+        return (
+            series.str.normalize('NFKD')
+            .str.replace(_RE_COMBINING, '', regex=True)
+            .str.replace(_RE_NONWORD, '', regex=True)
+            .str.replace(_RE_WS, ' ', regex=True)
+            .str.strip()
+        )
+    
     @staticmethod
     def calculate_growth_rates(values: pd.Series) -> Dict[str, float]:
         """
@@ -205,11 +305,14 @@ class HelperFunctions:
         if len(clean_values) < 2:
             return {"error": "Insuficientes valores válidos"}
         
-        first_value = clean_values.iloc[0]
-        last_value = clean_values.iloc[-1]
+        # Un solo buffer float64 para todas las tasas
+        values_arr = clean_values.to_numpy(dtype=np.float64)
+        first_value = values_arr[0]
+        last_value = values_arr[-1]
         
         # Crecimiento total
-        total_growth = ((last_value - first_value) / first_value) * 100
+        with np.errstate(divide='ignore', invalid='ignore'):
+            total_growth = ((last_value - first_value) / first_value) * 100
         
         # Crecimiento anualizado (CAGR)
         periods = len(clean_values) - 1
@@ -218,9 +321,11 @@ class HelperFunctions:
         else:
             annual_growth = 0
         
-        # Crecimiento promedio período a período
-        period_changes = clean_values.pct_change().dropna()
-        avg_period_growth = period_changes.mean() * 100
+        # Crecimiento promedio período a período (sin Series intermedias)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            period_changes = values_arr[1:] / values_arr[:-1] - 1.0
+        period_changes = period_changes[~np.isnan(period_changes)]  # 0/0
+        avg_period_growth = period_changes.mean() * 100 if period_changes.size else np.nan
         
         return {
             "total_growth_pct": round(total_growth, 2),
@@ -230,20 +335,25 @@ class HelperFunctions:
         }
     
     @staticmethod
-    def create_summary_statistics(df: pd.DataFrame, group_columns: List[str] = None) -> Dict[str, Any]:
+    def create_summary_statistics(
+        df: pd.DataFrame, 
+        group_columns: List[str] = None,
+        deep_memory: bool = False
+    ) -> Dict[str, Any]:
         """
         Crea estadísticas resumen para un DataFrame.
         
         Args:
             df: DataFrame a resumir
             group_columns: Columnas para agrupar (opcional)
+            deep_memory: Si medir la memoria real de columnas object (costoso)
             
         Returns:
             Diccionario con estadísticas
         """
         summary = {
             "shape": df.shape,
-            "memory_usage_mb": df.memory_usage(deep=True).sum() / 1024 / 1024,
+            "memory_usage_mb": df.memory_usage(deep=deep_memory).sum() / 1024 / 1024,
             "dtypes": df.dtypes.to_dict(),
             "null_counts": df.isnull().sum().to_dict(),
             "unique_counts": df.nunique().to_dict()
@@ -252,16 +362,22 @@ class HelperFunctions:
         # Estadísticas numéricas
         numeric_columns = df.select_dtypes(include=[np.number]).columns
         if len(numeric_columns) > 0:
-            summary["numeric_stats"] = df[numeric_columns].describe().to_dict()
+            summary["numeric_stats"] = HelperFunctions._describe_numeric(df[numeric_columns])
         
         # Estadísticas categóricas
         categorical_columns = df.select_dtypes(include=['object', 'category']).columns
         if len(categorical_columns) > 0:
             summary["categorical_stats"] = {}
             for col in categorical_columns:
+                # Reutilizar el conteo de únicos ya calculado para el resumen
+                unique_values = summary["unique_counts"][col]
+                if unique_values < _MAX_CATEGORICAL_CARDINALITY:
+                    most_common = df[col].value_counts().head(5).to_dict()
+                else:
+                    most_common = "omitido (alta cardinalidad)"
                 summary["categorical_stats"][col] = {
-                    "unique_values": df[col].nunique(),
-                    "most_common": df[col].value_counts().head(5).to_dict()
+                    "unique_values": unique_values,
+                    "most_common": most_common
                 }
         
         # Estadísticas por grupo si se especifican
@@ -272,6 +388,41 @@ class HelperFunctions:
         
         return summary
     
+    @staticmethod
+    def _describe_numeric(numeric_df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+        """
+        Equivalente a describe().to_dict() calculado sobre un solo bloque NumPy.
+        
+        Los NaN/NA se ignoran igual que en pandas; una columna sin valores
+        válidos queda con count 0 y el resto en NaN.
+        """
+        values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        counts = np.count_nonzero(~np.isnan(values), axis=0)
+        
+        # nanmean/nanpercentile avisan en columnas sin valores válidos
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            stats = {
+                'count': counts.astype(np.float64),
+                'mean': np.nanmean(values, axis=0),
+                'std': np.nanstd(values, axis=0, ddof=1),
+                'min': np.nanmin(values, axis=0),
+                '25%': None,
+                '50%': None,
+                '75%': None,
+                'max': np.nanmax(values, axis=0)
+            }
+            stats['25%'], stats['50%'], stats['75%'] = np.nanpercentile(
+                values, [25, 50, 75], axis=0
+            )
+        # Con un solo valor la desviación muestral no está definida
+        stats['std'][counts < 2] = np.nan
+        
+        return {
+            column: {name: float(stat_values[position]) for name, stat_values in stats.items()}
+            for position, column in enumerate(numeric_df.columns)
+        }
+    
     @staticmethod
     def format_large_numbers(number: Union[int, float], precision: int = 1) -> str:
         """
@@ -289,16 +440,46 @@ class HelperFunctions:
         
         abs_number = abs(number)
         
-        if abs_number >= 1_000_000_000:
-            formatted = f"{number / 1_000_000_000:.{precision}f}B"
-        elif abs_number >= 1_000_000:
-            formatted = f"{number / 1_000_000:.{precision}f}M"
-        elif abs_number >= 1_000:
-            formatted = f"{number / 1_000:.{precision}f}K"
+        # Índice de magnitud: un log10 y una búsqueda en tabla
+        if abs_number < 1_000:
+            idx = 0
+        elif math.isinf(abs_number):
+            idx = 3
         else:
-            formatted = f"{number:.{precision}f}"
+            idx = min(int(math.log10(abs_number)) // 3, 3)
+            # log10 redondea hacia arriba justo bajo cada potencia de mil
+            if abs_number < _MAGNITUDE_DIVISORS[idx]:
+                idx -= 1
         
-        return formatted
+        return f"{number / _MAGNITUDE_DIVISORS[idx]:.{precision}f}{_MAGNITUDE_SUFFIXES[idx]}"
+    
+    @staticmethod
+    def format_large_numbers_series(numbers: pd.Series, precision: int = 1) -> pd.Series:
+        """
+        Versión vectorizada de format_large_numbers para series completas.
+        
+        Args:
+            numbers: Serie numérica a formatear
+            precision: Decimales a mostrar
+            
+        Returns:
+            Serie de strings formateados ("N/A" para nulos)
+        """
+        values = numbers.to_numpy(dtype=np.float64, na_value=np.nan)
+        abs_values = np.abs(values)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            magnitude = np.floor(np.log10(np.where(abs_values >= 1_000, abs_values, 1)))
+        idx = (np.minimum(magnitude, 9) // 3).astype(np.intp)
+        idx -= (idx > 0) & (abs_values < np.take(_MAGNITUDE_DIVISORS, idx))
+        scaled = values / np.take(_MAGNITUDE_DIVISORS, idx)
+        suffixes = np.take(_MAGNITUDE_SUFFIXES, idx)
+        
+        formatted = [
+            "N/A" if np.isnan(value) else f"{value:.{precision}f}{suffix}"
+            for value, suffix in zip(scaled, suffixes)
+        ]
+        return pd.Series(formatted, index=numbers.index, name=numbers.name)
     
     @staticmethod
     def validate_file_path(file_path: Union[str, Path]) -> Path:
@@ -316,10 +497,13 @@ class HelperFunctions:
         """
         path = Path(file_path)
         
-        if not path.exists():
+        # Una sola llamada a stat() para existencia y tipo de archivo
+        try:
+            file_stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             raise FileNotFoundError(f"Archivo no encontrado: {path}")
         
-        if not path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             raise ValueError(f"La ruta no es un archivo: {path}")
         
         return path
@@ -346,5 +530,78 @@ class HelperFunctions:
             
             return numerator / denominator
             
-        except Exception:
+        except (TypeError, ValueError, ArithmeticError):
+            # Operandos no numéricos (str), arrays (pd.isna ambiguo) o desbordes
             return default
+    
+    @staticmethod
+    def safe_divide_arr(
+        numerator: Union[np.ndarray, pd.Series], 
+        denominator: Union[np.ndarray, pd.Series], 
+        default: float = 0.0
+    ) -> np.ndarray:
+        """
+        Versión vectorizada de safe_divide para arrays completos.
+        
+        Args:
+            numerator: Numeradores
+            denominator: Denominadores
+            default: Valor para divisiones por cero o con valores no finitos
+            
+        Returns:
+            Array con el resultado de cada división o el valor por defecto
+        """
+        numerator = np.asarray(numerator, dtype=np.float64)
+        denominator = np.asarray(denominator, dtype=np.float64)
+        
+        invalid = (denominator == 0) | ~np.isfinite(numerator) | ~np.isfinite(denominator)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(invalid, default, numerator / denominator)
+    
+    @staticmethod
+    def lttb_indices(values: Union[np.ndarray, pd.Series], n_out: int) -> np.ndarray:
+        """
+        Índices de los puntos que conserva el muestreo LTTB.
+        
+        Largest-Triangle-Three-Buckets reduce una serie equiespaciada a n_out
+        puntos conservando su forma visual: fija el primer y el último punto
+        y, en cada tramo intermedio, toma el que forma el triángulo de mayor
+        área con el punto elegido antes y el promedio del tramo siguiente.
+        
+        Args:
+            values: Valores de la serie en orden temporal
+            n_out: Cantidad de puntos a conservar
+            
+        Returns:
+            Índices posicionales crecientes (todos si la serie no excede n_out)
+        """
+        y = np.asarray(values, dtype=np.float64)
+        n = len(y)
+        if n_out >= n or n_out < 3:
+            return np.arange(n)
+        
+        # n_out - 2 tramos entre el primer y el último punto
+        edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+        selected = np.empty(n_out, dtype=np.int64)
+        selected[0], selected[-1] = 0, n - 1
+        
+        previous = 0
+        for i in range(n_out - 2):
+            start, stop = edges[i], edges[i + 1]
+            if i + 2 < len(edges):
+                next_start, next_stop = edges[i + 1], edges[i + 2]
+            else:
+                next_start, next_stop = n - 1, n
+            next_x = (next_start + next_stop - 1) / 2
+            next_y = y[next_start:next_stop].mean()
+            
+            positions = np.arange(start, stop)
+            area = np.abs(
+                (previous - next_x) * (y[start:stop] - y[previous])
+                - (previous - positions) * (next_y - y[previous])
+            )
+            # Los NaN no se eligen salvo que el tramo completo lo sea
+            previous = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+            selected[i + 1] = previous
+        
+        return selected
@@ -5,10 +5,11 @@ Clean Code: configuración centralizada de logging
 
 import logging
 import logging.handlers
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
 import sys
+import time
 
 from ...config import LoggingConfig
 
@@ -75,6 +76,7 @@ class LoggerConfig:
         return handler
 
 
+@lru_cache(maxsize=None)
 def setup_logger(
     name: str, 
     log_file: Optional[Path] = None, 
@@ -94,12 +96,16 @@ def setup_logger(
         Logger configurado
         
     Clean Code: Factory Method Pattern para creación de loggers
+    
+    Memoizado por argumentos: las llamadas repetidas (una por instancia
+    de cada componente) devuelven el logger sin volver a configurarlo.
     """
     # Crear logger
     logger = logging.getLogger(name)
     
-    # Evitar duplicar handlers si ya está configurado
-    if logger.handlers:
+    # Evitar duplicar handlers si ya fue configurado por esta función
+    # (un handler agregado por otro módulo no cuenta como configuración)
+    if getattr(logger, "_lrs_configured", False):
         return logger
     
     logger.setLevel(level)
@@ -119,6 +125,7 @@ def setup_logger(
     
     # Evitar propagación al root logger
     logger.propagate = False
+    logger._lrs_configured = True
     
     return logger
 
@@ -133,6 +140,8 @@ def setup_project_logging() -> None:
     
     # Configurar logger raíz del proyecto
     root_logger = logging.getLogger('los_rios_analysis')
+    if getattr(root_logger, "_lrs_configured", False):
+        return
     root_logger.setLevel(config.LOG_LEVEL)
     
     # Handler principal del proyecto
@@ -144,6 +153,7 @@ def setup_project_logging() -> None:
     
     root_logger.addHandler(file_handler)
     root_logger.addHandler(console_handler)
+    root_logger._lrs_configured = True
     
     # Configurar loggers de bibliotecas externas
     logging.getLogger('matplotlib').setLevel(logging.WARNING)
@@ -180,8 +190,9 @@ class PerformanceLogger:
     
     def start(self) -> None:
         """Inicia el monitoreo de tiempo."""
-        self.start_time = datetime.now()
-        self.logger.info(f"INICIO - {self.name}")
+        # Reloj monotónico: una lectura float sin objetos datetime/timedelta
+        self.start_time = time.perf_counter()
+        self.logger.info("INICIO - %s", self.name)
     
     def end(self, additional_info: str = "") -> float:
         """
@@ -194,17 +205,16 @@ class PerformanceLogger:
             Tiempo transcurrido en segundos
         """
         if self.start_time is None:
-            self.logger.warning(f"Timer no iniciado para {self.name}")
+            self.logger.warning("Timer no iniciado para %s", self.name)
             return 0.0
         
-        end_time = datetime.now()
-        elapsed_time = (end_time - self.start_time).total_seconds()
+        elapsed_time = time.perf_counter() - self.start_time
         
-        info_str = f"FIN - {self.name} - Tiempo: {elapsed_time:.2f}s"
+        # Argumentos diferidos: el mensaje solo se formatea si se emite
         if additional_info:
-            info_str += f" - {additional_info}"
-        
-        self.logger.info(info_str)
+            self.logger.info("FIN - %s - Tiempo: %.2fs - %s", self.name, elapsed_time, additional_info)
+        else:
+            self.logger.info("FIN - %s - Tiempo: %.2fs", self.name, elapsed_time)
         return elapsed_time
     
     def checkpoint(self, checkpoint_name: str) -> float:
@@ -218,13 +228,12 @@ class PerformanceLogger:
             Tiempo transcurrido desde el inicio
         """
         if self.start_time is None:
-            self.logger.warning(f"Timer no iniciado para checkpoint {checkpoint_name}")
+            self.logger.warning("Timer no iniciado para checkpoint %s", checkpoint_name)
             return 0.0
         
-        current_time = datetime.now()
-        elapsed_time = (current_time - self.start_time).total_seconds()
+        elapsed_time = time.perf_counter() - self.start_time
         
-        self.logger.info(f"CHECKPOINT - {checkpoint_name} - Tiempo: {elapsed_time:.2f}s")
+        self.logger.info("CHECKPOINT - %s - Tiempo: %.2fs", checkpoint_name, elapsed_time)
         return elapsed_time
 
 
@@ -234,29 +243,39 @@ def log_function_call(func):
     
     Clean Code: Decorator pattern para cross-cutting concerns
     """
+    # Logger resuelto una sola vez al decorar, no en cada llamada
+    logger = logging.getLogger(func.__module__)
+    
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(func.__module__)
-        
-        # Log de entrada
-        logger.debug(f"Llamando a {func.__name__} con args={args}, kwargs={kwargs}")
+        # Log de entrada (el repr de argumentos grandes, p. ej. DataFrames,
+        # solo se calcula si DEBUG está habilitado)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("Llamando a %s con args=%s, kwargs=%s", func.__name__, args, kwargs)
         
         try:
             # Ejecutar función
             result = func(*args, **kwargs)
             
             # Log de éxito
-            logger.debug(f"{func.__name__} ejecutada exitosamente")
+            if debug_enabled:
+                logger.debug("%s ejecutada exitosamente", func.__name__)
             return result
             
         except Exception as e:
             # Log de error
-            logger.error(f"Error en {func.__name__}: {str(e)}")
+            logger.error("Error en %s: %s", func.__name__, e)
             raise
     
     return wrapper
 
 
-def log_dataframe_info(df, operation_name: str, logger: logging.Logger) -> None:
+def log_dataframe_info(
+    df, 
+    operation_name: str, 
+    logger: logging.Logger,
+    deep: bool = False
+) -> None:
     """
     Registra información detallada sobre un DataFrame.
     
@@ -264,14 +283,25 @@ def log_dataframe_info(df, operation_name: str, logger: logging.Logger) -> None:
         df: DataFrame a loggear
         operation_name: Nombre de la operación
         logger: Logger a usar
+        deep: Si medir la memoria real de columnas object (recorre cada celda)
         
     Clean Code: Specific utility function
     """
-    if df is not None and hasattr(df, 'shape'):
-        logger.info(
-            f"{operation_name} - Shape: {df.shape}, "
-            f"Memory: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB, "
-            f"Columns: {list(df.columns)[:5]}..." if len(df.columns) > 5 else f"Columns: {list(df.columns)}"
-        )
-    else:
+    if df is None or not hasattr(df, 'shape'):
         logger.warning(f"{operation_name} - DataFrame es None o inválido")
+        return
+    
+    # Evitar el cálculo de memoria si el registro se va a descartar
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    # El condicional aplica solo al sufijo de columnas; antes abarcaba todo
+    # el mensaje y con pocas columnas se perdían nombre, forma y memoria
+    logger.info(
+        "%s - Shape: %s, Memory: %.2f MB, Columns: %s%s",
+        operation_name,
+        df.shape,
+        df.memory_usage(deep=deep).sum() / 1024 / 1024,
+        list(df.columns[:5]),
+        "..." if len(df.columns) > 5 else ""
+    )
@@ -5,12 +5,22 @@ Clean Code: Principio de Responsabilidad Única - solo validación
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, ClassVar
 import logging
-from datetime import datetime
 
 from ...config import LosRiosConfig, DataConfig
 
+# pyarrow es opcional: si está disponible, las columnas de texto se validan
+# sobre cadenas Arrow en lugar de objetos Python
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Marcas ASCII para el resumen en texto (fáciles de buscar en los logs)
+_STATUS = {True: "PASS", False: "FAIL"}
+
 
 class DataValidator:
     """
@@ -22,6 +32,10 @@ class DataValidator:
     - Descriptive Names: Nombres claros de métodos
     """
     
+    # Constantes de validación (compartidas por todas las instancias)
+    NUMERIC_COLUMNS: ClassVar[Tuple[str, ...]] = ('fuerza_de_trabajo', 'hombres', 'mujeres')
+    DUPLICATE_KEYS: ClassVar[Tuple[str, ...]] = ('ano_trimestre', 'region')
+    
     def __init__(self):
         """Inicializa el validador con configuraciones."""
         self.config = LosRiosConfig()
@@ -74,34 +88,68 @@ class DataValidator:
         errors = []
         
         try:
+            # Columnas presentes resueltas una sola vez para todas las verificaciones
+            columns = set(df.columns)
+            
             # Verificar columnas requeridas
             required_columns = self.data_config.REQUIRED_COLUMNS
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            missing_columns = [col for col in required_columns if col not in columns]
             
             if missing_columns:
                 errors.append(f"Columnas faltantes: {missing_columns}")
             
-            # Verificar que existan datos de Los Ríos
-            if 'region' in df.columns:
-                los_rios_data = df[df['region'] == self.config.REGION_CODE]
-                if los_rios_data.empty:
+            # Verificar que existan datos de Los Ríos (solo se cuentan filas,
+            # sin materializar el subconjunto filtrado)
+            if 'region' in columns:
+                los_rios_count = self._count_region_rows(df['region'], self.config.REGION_CODE)
+                if los_rios_count == 0:
                     errors.append(f"No se encontraron datos para {self.config.REGION_CODE}")
                 else:
-                    self.logger.info(f"Encontrados {len(los_rios_data)} registros de Los Ríos")
+                    self.logger.info(f"Encontrados {los_rios_count} registros de Los Ríos")
             
             # Verificar tipos de datos
-            if 'ano_trimestre' in df.columns:
-                if not pd.api.types.is_string_dtype(df['ano_trimestre']):
+            if 'ano_trimestre' in columns:
+                periods = df['ano_trimestre']
+                # Se acepta también la versión categórica con categorías de texto
+                if isinstance(periods.dtype, pd.CategoricalDtype):
+                    periods = periods.cat.categories
+                if not pd.api.types.is_string_dtype(periods):
                     errors.append("Columna 'ano_trimestre' debe ser string")
             
             # Verificar valores numéricos válidos
-            numeric_columns = ['fuerza_de_trabajo', 'hombres', 'mujeres']
-            for col in numeric_columns:
-                if col in df.columns:
-                    if df[col].isna().all():
+            present_columns = [col for col in self.NUMERIC_COLUMNS if col in columns]
+            # Tipos consultados una sola vez; solo se convierten las columnas
+            # que no son ya numéricas
+            is_numeric = df.dtypes[present_columns].map(pd.api.types.is_numeric_dtype)
+            numeric_present = [col for col in present_columns if is_numeric[col]]
+            
+            # Las columnas ya numéricas forman un único bloque (N, K): nulos y
+            # negativos se resuelven con una reducción por eje
+            block = df[numeric_present].to_numpy(dtype=np.float64, na_value=np.nan)
+            all_null = dict(zip(numeric_present, np.isnan(block).all(axis=0)))
+            has_negative = dict(zip(numeric_present, (block < 0).any(axis=0)))
+            
+            for col in present_columns:
+                if col in all_null:
+                    if all_null[col]:
                         errors.append(f"Columna '{col}' contiene solo valores nulos")
-                    elif (df[col] < 0).any():
+                    elif has_negative[col]:
                         errors.append(f"Columna '{col}' contiene valores negativos")
+                    continue
+                
+                values = df[col]
+                if values.isna().all():
+                    errors.append(f"Columna '{col}' contiene solo valores nulos")
+                    continue
+                
+                try:
+                    values = pd.to_numeric(values, errors='raise')
+                except (ValueError, TypeError):
+                    errors.append(f"Columna '{col}' no es numérica")
+                    continue
+                
+                if (values < 0).any():
+                    errors.append(f"Columna '{col}' contiene valores negativos")
             
             is_valid = len(errors) == 0
             return is_valid, errors
@@ -110,6 +158,21 @@ class DataValidator:
             errors.append(f"Error en validación: {str(e)}")
             return False, errors
     
+    @staticmethod
+    def _count_region_rows(regions: pd.Series, region_code: str) -> int:
+        """Cuenta las filas de una región; en categóricos compara códigos enteros."""
+        if isinstance(regions.dtype, pd.CategoricalDtype):
+            code = regions.cat.categories.get_indexer([region_code])[0]
+            if code < 0:
+                return 0
+            return int(np.count_nonzero(regions.cat.codes.to_numpy() == code))
+        
+        if not isinstance(regions.dtype, np.dtype):
+            # Tipos extensión (p. ej. string[pyarrow]): comparación nativa con NA
+            return int(regions.eq(region_code).sum())
+        
+        return int(np.count_nonzero(regions.to_numpy() == region_code))
+    
     def validate_date_format(self, date_column: pd.Series) -> bool:
         """
         Valida formato de fechas/períodos.
@@ -120,28 +183,27 @@ class DataValidator:
         Returns:
             True si el formato es válido
         """
-        try:
-            # Verificar que no esté vacía
-            if date_column.empty:
-                return False
-            
-            # Verificar formato típico del INE (ej: "2024-MAR")
-            sample_values = date_column.dropna().head(10)
-            
-            for value in sample_values:
-                if not isinstance(value, str):
-                    return False
-                
-                # Formato esperado: YYYY-MES o similar
-                if len(value.split('-')) != 2:
-                    self.logger.warning(f"Formato de fecha inesperado: {value}")
-                    return False
-            
+        # Verificar que no esté vacía
+        if date_column.empty:
+            return False
+        
+        # Verificar formato típico del INE (ej: "2024-MAR")
+        sample_values = date_column.dropna().head(10)
+        if sample_values.empty:
             return True
-            
-        except Exception as e:
-            self.logger.error(f"Error validando formato de fecha: {str(e)}")
+        
+        if not pd.api.types.is_string_dtype(sample_values):
+            return False
+        
+        # Formato esperado: YYYY-MES o similar (exactamente un guion),
+        # contado de forma vectorizada sobre la muestra
+        invalid_format = sample_values.str.count('-').ne(1)
+        if invalid_format.any():
+            first_invalid = sample_values[invalid_format].iloc[0]
+            self.logger.warning(f"Formato de fecha inesperado: {first_invalid}")
             return False
+        
+        return True
     
     def validate_numeric_range(
         self, 
@@ -168,25 +230,29 @@ class DataValidator:
                 errors.append("La serie no es numérica")
                 return False, errors
             
+            # Un único buffer float64 para todos los conteos (los nulos,
+            # incluidos los NA de tipos nullable, quedan como NaN)
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            
             # Verificar valores nulos
-            null_count = series.isna().sum()
+            null_count = np.count_nonzero(np.isnan(values))
             if null_count > 0:
                 errors.append(f"Encontrados {null_count} valores nulos")
             
             # Verificar rango mínimo
             if min_value is not None:
-                below_min = (series < min_value).sum()
+                below_min = np.count_nonzero(values < min_value)
                 if below_min > 0:
                     errors.append(f"{below_min} valores por debajo del mínimo ({min_value})")
             
             # Verificar rango máximo
             if max_value is not None:
-                above_max = (series > max_value).sum()
+                above_max = np.count_nonzero(values > max_value)
                 if above_max > 0:
                     errors.append(f"{above_max} valores por encima del máximo ({max_value})")
             
             # Verificar valores infinitos
-            inf_count = np.isinf(series).sum()
+            inf_count = np.count_nonzero(np.isinf(values))
             if inf_count > 0:
                 errors.append(f"Encontrados {inf_count} valores infinitos")
             
@@ -210,14 +276,20 @@ class DataValidator:
         errors = []
         
         try:
+            # Columnas presentes resueltas una sola vez para todas las verificaciones
+            columns = set(df.columns)
+            
             # Verificar que total = hombres + mujeres
-            if all(col in df.columns for col in ['fuerza_de_trabajo', 'hombres', 'mujeres']):
-                calculated_total = df['hombres'] + df['mujeres']
-                difference = abs(df['fuerza_de_trabajo'] - calculated_total)
+            if columns.issuperset(self.NUMERIC_COLUMNS):
+                total, men, women = (
+                    df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                    for col in self.NUMERIC_COLUMNS
+                )
+                difference = np.abs(total - (men + women))
                 
                 # Permitir pequeñas diferencias de redondeo
                 tolerance = 0.1
-                inconsistent_rows = (difference > tolerance).sum()
+                inconsistent_rows = np.count_nonzero(difference > tolerance)
                 
                 if inconsistent_rows > 0:
                     errors.append(
@@ -226,16 +298,24 @@ class DataValidator:
                     )
             
             # Verificar duplicados
-            if 'ano_trimestre' in df.columns and 'region' in df.columns:
-                duplicates = df.duplicated(subset=['ano_trimestre', 'region']).sum()
-                if duplicates > 0:
+            if columns.issuperset(self.DUPLICATE_KEYS):
+                # El conteo exacto solo se calcula si hay algún duplicado
+                duplicated_mask = df.duplicated(subset=list(self.DUPLICATE_KEYS))
+                if duplicated_mask.any():
+                    duplicates = duplicated_mask.sum()
                     errors.append(f"Encontrados {duplicates} registros duplicados")
             
             # Verificar tendencias anómalas (cambios extremos)
-            if 'fuerza_de_trabajo' in df.columns and len(df) > 1:
-                df_sorted = df.sort_values('ano_trimestre')
-                pct_change = df_sorted['fuerza_de_trabajo'].pct_change().abs()
-                extreme_changes = (pct_change > 0.5).sum()  # Cambios > 50%
+            if 'fuerza_de_trabajo' in columns and len(df) > 1:
+                df_sorted = df[['ano_trimestre', 'fuerza_de_trabajo']].sort_values('ano_trimestre')
+                values = self._forward_fill(
+                    df_sorted['fuerza_de_trabajo'].to_numpy(dtype=np.float64, na_value=np.nan)
+                )
+                
+                # Variación relativa entre períodos consecutivos (= pct_change)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    pct_change = np.abs(values[1:] / values[:-1] - 1)
+                extreme_changes = np.count_nonzero(pct_change > 0.5)  # Cambios > 50%
                 
                 if extreme_changes > 0:
                     errors.append(f"Detectados {extreme_changes} cambios extremos en fuerza de trabajo")
@@ -247,22 +327,41 @@ class DataValidator:
             errors.append(f"Error validando consistencia: {str(e)}")
             return False, errors
     
-    def generate_validation_report(self, df: pd.DataFrame) -> Dict[str, Any]:
+    @staticmethod
+    def _forward_fill(values: np.ndarray) -> np.ndarray:
+        """Propaga hacia adelante el último valor no nulo (como Series.ffill)."""
+        valid = ~np.isnan(values)
+        if valid.all():
+            return values
+        
+        last_valid = np.where(valid, np.arange(values.size), 0)
+        np.maximum.accumulate(last_valid, out=last_valid)
+        return values[last_valid]
+    
+    def generate_validation_report(
+        self, 
+        df: pd.DataFrame, 
+        deep_memory: bool = False
+    ) -> Dict[str, Any]:
         """
         Genera un reporte completo de validación.
         
         Args:
             df: DataFrame a validar
+            deep_memory: Si medir la memoria real de columnas object (costoso)
             
         Returns:
             Diccionario con resultados de validación
         """
+        # Importación diferida: solo el reporte completo necesita la marca de tiempo
+        from datetime import datetime
+        
         report = {
             "timestamp": datetime.now().isoformat(),
             "dataframe_info": {
                 "rows": len(df),
                 "columns": len(df.columns),
-                "memory_usage_mb": df.memory_usage(deep=True).sum() / 1024 / 1024
+                "memory_usage_mb": df.memory_usage(deep=deep_memory).sum() / 1024 / 1024
             },
             "validations": {},
             "overall_valid": True,
@@ -274,14 +373,25 @@ class DataValidator:
             # Validación básica de DataFrame
             report["validations"]["basic_structure"] = self.validate_dataframe(df)
             
+            # Sin estructura válida (vacío o sin columnas) el resto de las
+            # validaciones no aporta información: se termina de inmediato
+            if not report["validations"]["basic_structure"]:
+                report["errors"].append("DataFrame sin estructura válida (vacío o sin columnas)")
+                report["overall_valid"] = False
+                return report
+            
+            # Las validaciones sobre texto (región, períodos, duplicados) usan
+            # la copia con cadenas Arrow; las métricas conservan los tipos originales
+            validation_df = self._arrowize(df)
+            
             # Validación específica de Los Ríos
-            is_valid, errors = self.validate_los_rios_data(df)
+            is_valid, errors = self.validate_los_rios_data(validation_df)
             report["validations"]["los_rios_data"] = is_valid
             if not is_valid:
                 report["errors"].extend(errors)
             
             # Validación de consistencia
-            is_consistent, consistency_errors = self.validate_data_consistency(df)
+            is_consistent, consistency_errors = self.validate_data_consistency(validation_df)
             report["validations"]["data_consistency"] = is_consistent
             if not is_consistent:
                 report["errors"].extend(consistency_errors)
@@ -299,30 +409,86 @@ class DataValidator:
             report["overall_valid"] = False
             return report
     
+    @staticmethod
+    def format_validation_report(report: Dict[str, Any]) -> str:
+        """
+        Resume en texto plano un reporte de generate_validation_report.
+        
+        Args:
+            report: Diccionario retornado por generate_validation_report
+            
+        Returns:
+            Texto con una línea PASS/FAIL por validación y los errores
+        """
+        validations = report.get("validations", {})
+        passed = sum(bool(result) for result in validations.values())
+        body = "\n".join(
+            f"{name.replace('_', ' ').title()}: {_STATUS[bool(result)]}"
+            for name, result in validations.items()
+        )
+        errors = "".join(f"\n  - {error}" for error in report.get("errors", []))
+        
+        return (
+            f"Reporte de validación\n{'=' * 25}\n{body}\n"
+            f"Total: {passed}/{len(validations)} validaciones aprobadas "
+            f"({_STATUS[bool(report.get('overall_valid', False))]}){errors}"
+        )
+    
+    @staticmethod
+    def _arrowize(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convierte las columnas object a string[pyarrow] si pyarrow está disponible.
+        
+        Devuelve una copia convertida (o el mismo DataFrame si no aplica);
+        el original no se modifica.
+        """
+        if not _HAS_PYARROW or not isinstance(df, pd.DataFrame):
+            return df
+        
+        object_columns = df.select_dtypes(include='object').columns
+        if object_columns.empty:
+            return df
+        
+        try:
+            return df.astype({col: 'string[pyarrow]' for col in object_columns})
+        except (TypeError, ValueError):
+            # Columnas con objetos no convertibles: se valida el original
+            return df
+    
     def _calculate_data_quality_metrics(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Calcula métricas de calidad de datos."""
         try:
+            n_rows = len(df)
+            dtypes = df.dtypes
+            validity = dtypes.astype(str).to_dict()
+            
+            # Sin filas los porcentajes no están definidos: solo se informan tipos
+            if n_rows == 0:
+                return {"completeness": {}, "uniqueness": {}, "validity": validity}
+            
+            # Completitud (% de valores no nulos): las columnas enteras/booleanas
+            # de NumPy no admiten nulos y se omiten; en el resto any() descarta
+            # primero las columnas sin nulos y solo se calcula el porcentaje en las demás
+            can_hold_nulls = np.array([
+                not (isinstance(dtype, np.dtype) and dtype.kind in 'iub') for dtype in dtypes
+            ], dtype=bool)
+            has_nulls = np.zeros(len(dtypes), dtype=bool)
+            has_nulls[can_hold_nulls] = df.iloc[:, can_hold_nulls].isna().any().to_numpy()
+            non_null_pct = (df.iloc[:, has_nulls].notna().mean() * 100).round(2)
+            
+            # Unicidad (% de valores únicos): una llamada por DataFrame,
+            # no una por columna
+            unique_pct = (df.nunique() / n_rows * 100).round(2)
+            
             metrics = {
-                "completeness": {},
-                "uniqueness": {},
-                "validity": {}
+                "completeness": {
+                    col: non_null_pct[col] if column_has_nulls else 100.0
+                    for col, column_has_nulls in zip(df.columns, has_nulls)
+                },
+                "uniqueness": unique_pct.to_dict(),
+                "validity": validity
             }
             
-            # Completitud (% de valores no nulos)
-            for col in df.columns:
-                non_null_pct = (df[col].notna().sum() / len(df)) * 100
-                metrics["completeness"][col] = round(non_null_pct, 2)
-            
-            # Unicidad (% de valores únicos)
-            for col in df.columns:
-                unique_pct = (df[col].nunique() / len(df)) * 100
-                metrics["uniqueness"][col] = round(unique_pct, 2)
-            
-            # Validez de tipos de datos
-            for col in df.columns:
-                dtype_str = str(df[col].dtype)
-                metrics["validity"][col] = dtype_str
-            
             return metrics
             
         except Exception as e:
@@ -4,18 +4,85 @@ Clean Code: Factory Pattern para creación de visualizaciones
 """
 
 import pandas as pd
+import numpy as np
+import matplotlib
+import os
+import sys
+
+# Sin pantalla (servidor, CI) se fija el backend Agg antes de importar
+# pyplot, salvo que el entorno ya haya elegido uno (MPLBACKEND, Jupyter)
+# o que pyplot ya esté cargado
+if (
+    sys.platform.startswith('linux')
+    and not os.environ.get('DISPLAY')
+    and not os.environ.get('WAYLAND_DISPLAY')
+    and 'MPLBACKEND' not in os.environ
+    and 'matplotlib.pyplot' not in sys.modules
+):
+    matplotlib.use('Agg', force=False)
+
 import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Callable
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+import hashlib
+import weakref
 import logging
 
 from ...config import LosRiosConfig, VisualizationConfig
 from ..utils.logger import setup_logger
 from ..utils.helpers import HelperFunctions
 
+# orjson es opcional: serializa los arrays NumPy de la figura sin pasar
+# por listas de Python
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Figuras Plotly memoizadas por instancia (las más recientes)
+_FIGURE_CACHE_SIZE = 128
+
+# Sobre esta cantidad de puntos las series se dibujan con WebGL (Scattergl)
+# en lugar de SVG, que se degrada con miles de marcadores
+_WEBGL_THRESHOLD = 5000
+
+# Figuras Matplotlib libres que se conservan por (filas, columnas, tamaño)
+_FIG_POOL_SIZE = 4
+
+# Columnas que necesita la comparación por género
+_GENDER_COLUMNS = frozenset(('hombres', 'mujeres', 'ano_trimestre'))
+
+# Métodos que dispatch()/build_many() pueden invocar por nombre
+_DISPATCHABLE = frozenset((
+    'create_time_series_chart',
+    'create_gender_comparison_chart',
+    'create_distribution_chart',
+    'create_correlation_heatmap',
+    'create_trend_analysis_chart'
+))
+
+
+def _json_default(obj: Any) -> Any:
+    """Convierte para orjson los tipos que no serializa de forma nativa."""
+    if isinstance(obj, np.ndarray):
+        # Arrays de objetos (p. ej. etiquetas de período)
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Tipo no serializable: {type(obj).__name__}")
+
+
+@lru_cache(maxsize=64)
+def _column_label(column: str) -> str:
+    """Etiqueta legible de una columna ('fuerza_de_trabajo' -> 'Fuerza De Trabajo')."""
+    return column.replace('_', ' ').title()
+
 
 class ChartFactory:
     """
@@ -24,18 +91,90 @@ class ChartFactory:
     Clean Code: Factory Pattern - centraliza creación de visualizaciones
     """
     
+    class _BoundFactory:
+        """
+        Gráficos Plotly de un DataFrame fijo (ver ChartFactory.bind()).
+        
+        La huella se toma al asociar los datos: el DataFrame no debe
+        modificarse mientras se use el objeto.
+        """
+        
+        def __init__(self, parent: "ChartFactory", data: pd.DataFrame):
+            self.parent = parent
+            self.data = data
+            self.fingerprint = parent._data_fingerprint(data)
+            self._column_fingerprints: Dict[str, int] = {}
+        
+        def time_series(
+            self, y_column: str, title: str = None, as_json: bool = False
+        ) -> Union[go.Figure, str]:
+            """Serie temporal (ver create_time_series_chart)."""
+            return self.parent._cached_plotly_figure(
+                'time_series', self.data, self.parent._create_plotly_time_series,
+                y_column, title, fingerprint=self.fingerprint, as_json=as_json
+            )
+        
+        def gender_comparison(self, as_json: bool = False) -> Union[go.Figure, str]:
+            """Comparación por género (ver create_gender_comparison_chart)."""
+            self.parent._check_gender_columns(self.data)
+            return self.parent._cached_plotly_figure(
+                'gender_comparison', self.data, self.parent._create_plotly_gender_comparison,
+                fingerprint=self.fingerprint, as_json=as_json
+            )
+        
+        def distribution(
+            self, column: str, bins: int = 30, as_json: bool = False
+        ) -> Union[go.Figure, str]:
+            """
+            Distribución de una columna (ver create_distribution_chart).
+            
+            La huella es la de la Serie de la columna, tomada una vez por
+            columna, para compartir entradas con create_distribution_chart.
+            """
+            series = self.data[column]
+            if column not in self._column_fingerprints:
+                self._column_fingerprints[column] = self.parent._data_fingerprint(series)
+            return self.parent._cached_plotly_figure(
+                'distribution', series, self.parent._create_plotly_distribution,
+                bins, fingerprint=self._column_fingerprints[column], as_json=as_json
+            )
+        
+        def trend_analysis(self, y_column: str, as_json: bool = False) -> Union[go.Figure, str]:
+            """Análisis de tendencia (ver create_trend_analysis_chart)."""
+            return self.parent._cached_plotly_figure(
+                'trend_analysis', self.data, self.parent._create_plotly_trend_analysis,
+                y_column, fingerprint=self.fingerprint, as_json=as_json
+            )
+    
+    # El estilo de Matplotlib/Seaborn es estado global del proceso:
+    # basta con configurarlo una vez, no en cada instancia
+    _style_initialized: bool = False
+    
     def __init__(self, config: Optional[LosRiosConfig] = None):
         """Inicializa la factory de gráficos."""
         self.config = config or LosRiosConfig()
         self.viz_config = VisualizationConfig()
         self.logger = setup_logger(self.__class__.__name__)
         self.helpers = HelperFunctions()
+        self._figure_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+        self._fig_pool: Dict[tuple, List[plt.Figure]] = defaultdict(list)
+        self._fig_leases: Optional[List[plt.Figure]] = None
+        # Figura -> (clave del pool, ejes de la grilla); claves débiles para
+        # no retener figuras que el llamador ya descartó
+        self._fig_meta: "weakref.WeakKeyDictionary[plt.Figure, tuple]" = weakref.WeakKeyDictionary()
         
         # Configurar estilo
         self._setup_plotting_style()
     
-    def _setup_plotting_style(self) -> None:
-        """Configura el estilo de los gráficos."""
+    @classmethod
+    def _setup_plotting_style(cls) -> None:
+        """Configura el estilo de los gráficos (una sola vez por proceso)."""
+        if cls._style_initialized:
+            return
+        
+        # Seaborn se importa al configurar el primer gráfico, no al importar el módulo
+        import seaborn as sns
+        
         # Matplotlib/Seaborn
         plt.style.use('seaborn-v0_8-whitegrid')
         sns.set_palette("husl")
@@ -50,14 +189,18 @@ class ChartFactory:
             'ytick.labelsize': 10,
             'legend.fontsize': 11
         })
+        
+        cls._style_initialized = True
     
     def create_time_series_chart(
         self, 
         data: pd.DataFrame, 
         y_column: str,
         title: str = None,
-        chart_type: str = "plotly"
-    ) -> Union[plt.Figure, go.Figure]:
+        chart_type: str = "plotly",
+        as_json: bool = False,
+        raw_dict: bool = False
+    ) -> Union[plt.Figure, go.Figure, str, Dict[str, Any]]:
         """
         Crea gráfico de serie temporal.
         
@@ -66,89 +209,338 @@ class ChartFactory:
             y_column: Columna para el eje Y
             title: Título del gráfico
             chart_type: Tipo de gráfico ("plotly" o "matplotlib")
+            as_json: Si retornar la figura serializada a JSON (solo plotly)
+            raw_dict: Si retornar un dict de Plotly armado sin go.Figure (solo plotly)
             
         Returns:
-            Figura del gráfico
+            Figura del gráfico (o su JSON/dict según as_json/raw_dict)
         """
         try:
+            if chart_type == "plotly" and raw_dict:
+                return self._build_time_series_dict(data, y_column, title)
             if chart_type == "plotly":
-                return self._create_plotly_time_series(data, y_column, title)
+                return self._cached_plotly_figure(
+                    'time_series', data, self._create_plotly_time_series, y_column, title,
+                    as_json=as_json
+                )
             else:
                 return self._create_matplotlib_time_series(data, y_column, title)
                 
         except Exception as e:
-            self.logger.error(f"Error creando gráfico de serie temporal: {str(e)}")
+            self.logger.exception("Error creando gráfico de serie temporal: %s", e)
             raise
     
     def create_gender_comparison_chart(
         self, 
         data: pd.DataFrame,
-        chart_type: str = "plotly"
-    ) -> Union[plt.Figure, go.Figure]:
+        chart_type: str = "plotly",
+        as_json: bool = False,
+        raw_dict: bool = False
+    ) -> Union[plt.Figure, go.Figure, str, Dict[str, Any]]:
         """Crea gráfico de comparación por género."""
         try:
-            if not all(col in data.columns for col in ['hombres', 'mujeres', 'ano_trimestre']):
-                raise ValueError("Columnas requeridas no encontradas")
+            self._check_gender_columns(data)
             
+            if chart_type == "plotly" and raw_dict:
+                return self._build_gender_comparison_dict(data)
             if chart_type == "plotly":
-                return self._create_plotly_gender_comparison(data)
+                return self._cached_plotly_figure(
+                    'gender_comparison', data, self._create_plotly_gender_comparison,
+                    as_json=as_json
+                )
             else:
                 return self._create_matplotlib_gender_comparison(data)
                 
         except Exception as e:
-            self.logger.error(f"Error creando gráfico de género: {str(e)}")
+            self.logger.exception("Error creando gráfico de género: %s", e)
             raise
     
     def create_distribution_chart(
         self, 
         data: pd.Series,
         chart_type: str = "plotly",
-        bins: int = 30
-    ) -> Union[plt.Figure, go.Figure]:
+        bins: int = 30,
+        as_json: bool = False
+    ) -> Union[plt.Figure, go.Figure, str]:
         """Crea gráfico de distribución."""
         try:
             if chart_type == "plotly":
-                return self._create_plotly_distribution(data, bins)
+                return self._cached_plotly_figure(
+                    'distribution', data, self._create_plotly_distribution, bins,
+                    as_json=as_json
+                )
             else:
                 return self._create_matplotlib_distribution(data, bins)
                 
         except Exception as e:
-            self.logger.error(f"Error creando gráfico de distribución: {str(e)}")
+            self.logger.exception("Error creando gráfico de distribución: %s", e)
             raise
     
     def create_correlation_heatmap(
         self, 
         correlation_matrix: pd.DataFrame,
-        chart_type: str = "plotly"
-    ) -> Union[plt.Figure, go.Figure]:
+        chart_type: str = "plotly",
+        as_json: bool = False
+    ) -> Union[plt.Figure, go.Figure, str]:
         """Crea mapa de calor de correlaciones."""
         try:
             if chart_type == "plotly":
-                return self._create_plotly_heatmap(correlation_matrix)
+                return self._cached_plotly_figure(
+                    'heatmap', correlation_matrix, self._create_plotly_heatmap,
+                    as_json=as_json
+                )
             else:
                 return self._create_matplotlib_heatmap(correlation_matrix)
                 
         except Exception as e:
-            self.logger.error(f"Error creando mapa de calor: {str(e)}")
+            self.logger.exception("Error creando mapa de calor: %s", e)
             raise
     
     def create_trend_analysis_chart(
         self, 
         data: pd.DataFrame,
         y_column: str,
-        chart_type: str = "plotly"
-    ) -> Union[plt.Figure, go.Figure]:
+        chart_type: str = "plotly",
+        as_json: bool = False
+    ) -> Union[plt.Figure, go.Figure, str]:
         """Crea gráfico de análisis de tendencia."""
         try:
             if chart_type == "plotly":
-                return self._create_plotly_trend_analysis(data, y_column)
+                return self._cached_plotly_figure(
+                    'trend_analysis', data, self._create_plotly_trend_analysis, y_column,
+                    as_json=as_json
+                )
             else:
                 return self._create_matplotlib_trend_analysis(data, y_column)
                 
         except Exception as e:
-            self.logger.error(f"Error creando análisis de tendencia: {str(e)}")
+            self.logger.exception("Error creando análisis de tendencia: %s", e)
             raise
     
+    def dispatch(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Invoca por nombre uno de los métodos create_*.
+        
+        Las figuras Plotly se retornan como dict (fig.to_dict()), que es
+        barato de enviar entre procesos.
+        """
+        if method_name not in _DISPATCHABLE:
+            raise ValueError(f"Método de gráfico no soportado: {method_name}")
+        
+        result = getattr(self, method_name)(*args, **kwargs)
+        return result.to_dict() if isinstance(result, go.Figure) else result
+    
+    def build_many(
+        self,
+        specs: List[tuple],
+        max_workers: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Construye varios gráficos en paralelo, uno por proceso trabajador.
+        
+        Args:
+            specs: Lista de (nombre_metodo, args, kwargs) para dispatch()
+            max_workers: Procesos a usar (por defecto, los núcleos disponibles)
+            
+        Returns:
+            Resultados de dispatch() en el mismo orden que specs
+        """
+        specs = [(name, tuple(args), dict(kwargs)) for name, args, kwargs in specs]
+        unsupported = [name for name, _, _ in specs if name not in _DISPATCHABLE]
+        if unsupported:
+            raise ValueError(f"Métodos de gráfico no soportados: {unsupported}")
+        
+        # Con un solo gráfico no compensa levantar procesos
+        if len(specs) <= 1 or max_workers == 1:
+            return [self.dispatch(name, *args, **kwargs) for name, args, kwargs in specs]
+        
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_chart_worker,
+            initargs=(self.config,)
+        ) as executor:
+            return list(executor.map(_build_chart_in_worker, specs))
+    
+    def bind(self, data: pd.DataFrame) -> "ChartFactory._BoundFactory":
+        """
+        Asocia un DataFrame a la factory para generar varios gráficos de él.
+        
+        La huella del contenido se calcula una sola vez y la comparten las
+        figuras memoizadas de todos los gráficos del mismo DataFrame.
+        """
+        return self._BoundFactory(self, data)
+    
+    @staticmethod
+    def _check_gender_columns(data: pd.DataFrame) -> None:
+        """Verifica las columnas que necesita la comparación por género."""
+        if not _GENDER_COLUMNS.issubset(data.columns):
+            raise ValueError("Columnas requeridas no encontradas")
+    
+    @staticmethod
+    def _data_fingerprint(data: Union[pd.DataFrame, pd.Series]) -> int:
+        """Huella de 64 bits del contenido (valores, índice y etiquetas)."""
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        if isinstance(data, pd.DataFrame):
+            labels = (tuple(data.columns), tuple(data.dtypes.astype(str)))
+        else:
+            labels = (data.name, str(data.dtype))
+        hasher.update(repr(labels).encode())
+        return int.from_bytes(hasher.digest(), 'little')
+    
+    def _cached_plotly_figure(
+        self,
+        kind: str,
+        data: Union[pd.DataFrame, pd.Series],
+        builder: Callable[..., go.Figure],
+        *args: Any,
+        fingerprint: Optional[int] = None,
+        as_json: bool = False
+    ) -> Union[go.Figure, str]:
+        """
+        Construye una figura Plotly o la reconstruye desde la caché.
+        
+        La clave combina el tipo de gráfico, la huella del contenido y los
+        argumentos; se guarda fig.to_dict() y cada acierto retorna una figura
+        nueva, de modo que el llamador puede modificarla sin afectar la caché.
+        Con as_json el JSON se escribe directamente desde el dict guardado,
+        sin reconstruir la figura. Si se recibe fingerprint (ver bind()) no
+        se recalcula la huella.
+        """
+        if fingerprint is None:
+            fingerprint = self._data_fingerprint(data)
+        key = (kind, fingerprint) + args
+        cached = self._figure_cache.get(key)
+        if cached is not None:
+            self._figure_cache.move_to_end(key)
+            return self._dict_to_json(cached) if as_json else go.Figure(cached)
+        
+        fig = builder(data, *args)
+        fig_dict = fig.to_dict()
+        self._figure_cache[key] = fig_dict
+        if len(self._figure_cache) > _FIGURE_CACHE_SIZE:
+            self._figure_cache.popitem(last=False)
+        return self._dict_to_json(fig_dict) if as_json else fig
+    
+    def clear_figure_cache(self) -> None:
+        """Descarta las figuras memoizadas."""
+        self._figure_cache.clear()
+    
+    def _get_fig(self, nrows: int = 1, ncols: int = 1, figsize: tuple = (12, 6)) -> tuple:
+        """
+        Entrega una figura Matplotlib y sus ejes, reutilizando una del pool.
+        
+        Los ejes reutilizados se limpian con cla(); si la figura ganó ejes
+        extra (la barra de color del heatmap) se vacía y se rearma la grilla.
+        """
+        key = (nrows, ncols, tuple(figsize))
+        pool = self._fig_pool[key]
+        if pool:
+            fig = pool.pop()
+            axes = self._fig_meta[fig][1]
+            own_axes = list(np.atleast_1d(axes).ravel())
+            if len(fig.axes) != len(own_axes):
+                fig.clear()
+                axes = fig.subplots(nrows, ncols)
+                self._fig_meta[fig] = (key, axes)
+            else:
+                for ax in own_axes:
+                    ax.cla()
+        else:
+            # constrained_layout se resuelve al dibujar, sin la pasada extra
+            # de tight_layout; debe fijarse antes de agregar barras de color
+            fig, axes = plt.subplots(nrows, ncols, figsize=figsize, layout='constrained')
+            self._fig_meta[fig] = (key, axes)
+        
+        if self._fig_leases is not None:
+            self._fig_leases.append(fig)
+        return fig, axes
+    
+    def release_figure(self, fig: plt.Figure) -> None:
+        """Devuelve al pool una figura Matplotlib que el llamador ya no usa."""
+        meta = self._fig_meta.get(fig)
+        if meta is None:
+            return
+        
+        pool = self._fig_pool[meta[0]]
+        if any(pooled is fig for pooled in pool):
+            return
+        if len(pool) < _FIG_POOL_SIZE:
+            pool.append(fig)
+        else:
+            del self._fig_meta[fig]
+            plt.close(fig)
+    
+    @contextmanager
+    def reuse_figures(self):
+        """
+        Devuelve al pool, al salir del bloque, las figuras Matplotlib creadas en él.
+        
+        Pensado para lotes de gráficos: cada figura debe guardarse (savefig)
+        dentro del bloque, ya que después puede reutilizarse.
+        """
+        previous, self._fig_leases = self._fig_leases, []
+        try:
+            yield self
+        finally:
+            leases, self._fig_leases = self._fig_leases, previous
+            for fig in leases:
+                self.release_figure(fig)
+    
+    @staticmethod
+    def figure_to_json(fig: go.Figure) -> str:
+        """
+        Serializa una figura Plotly a JSON.
+        
+        Con orjson los arrays numéricos se escriben directamente desde NumPy;
+        sin orjson se usa el serializador de Plotly.
+        """
+        return ChartFactory._dict_to_json(fig.to_dict())
+    
+    @staticmethod
+    def _dict_to_json(fig_dict: Dict[str, Any]) -> str:
+        """Serializa el dict de una figura (fig.to_dict()) a JSON."""
+        if orjson is None:
+            return pio.to_json(fig_dict, validate=False)
+        
+        return orjson.dumps(
+            fig_dict,
+            option=orjson.OPT_SERIALIZE_NUMPY,
+            default=_json_default
+        ).decode()
+    
+    @staticmethod
+    def _percent_changes(series: pd.Series) -> np.ndarray:
+        """
+        Cambio porcentual entre períodos consecutivos sobre un ndarray.
+        
+        El primer período queda en NaN; los nulos no se rellenan hacia
+        adelante (equivale a pct_change(fill_method=None) * 100).
+        """
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        pct = np.empty_like(values)
+        pct[:1] = np.nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(values[1:], values[:-1], out=pct[1:])
+        pct[1:] -= 1
+        pct *= 100
+        return pct
+    
+    @staticmethod
+    def _linear_trend(values: np.ndarray) -> np.ndarray:
+        """
+        Recta de mínimos cuadrados evaluada en cada período.
+        
+        Forma cerrada (sin polyfit/SVD): pendiente = cov(x, y) / var(x),
+        pasando por (media_x, media_y).
+        """
+        y_values = np.asarray(values, dtype=np.float64)
+        x_centered = np.arange(len(y_values), dtype=np.float64)
+        x_centered -= x_centered.mean()
+        y_mean = y_values.mean()
+        slope = np.dot(x_centered, y_values - y_mean) / np.dot(x_centered, x_centered)
+        return y_mean + slope * x_centered
+    
     def _create_plotly_time_series(
         self, 
         data: pd.DataFrame, 
@@ -156,37 +548,38 @@ class ChartFactory:
         title: str = None
     ) -> go.Figure:
         """Crea serie temporal con Plotly."""
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=data['ano_trimestre'],
-            y=data[y_column],
+        label = _column_label(y_column)
+        scatter = go.Scattergl if len(data) > _WEBGL_THRESHOLD else go.Scatter
+        # Columnas extraídas una vez como ndarray: Plotly las toma sin copiarlas
+        periods = data['ano_trimestre'].to_numpy()
+        values = data[y_column].to_numpy()
+        
+        # Las trazas se reúnen en una lista y la figura se construye una sola vez
+        traces = [scatter(
+            x=periods,
+            y=values,
             mode='lines+markers',
-            name=y_column.replace('_', ' ').title(),
+            name=label,
             line=dict(color=self.viz_config.PRIMARY_COLOR, width=3),
             marker=dict(size=8)
-        ))
+        )]
         
         # Añadir línea de tendencia
         if len(data) > 2:
-            import numpy as np
-            x_numeric = np.arange(len(data))
-            z = np.polyfit(x_numeric, data[y_column], 1)
-            trend_line = np.poly1d(z)(x_numeric)
-            
-            fig.add_trace(go.Scatter(
-                x=data['ano_trimestre'],
-                y=trend_line,
+            traces.append(scatter(
+                x=periods,
+                y=self._linear_trend(values),
                 mode='lines',
                 name='Tendencia',
                 line=dict(color='red', width=2, dash='dash'),
                 opacity=0.7
             ))
         
+        fig = go.Figure(data=traces)
         fig.update_layout(
-            title=title or f'Evolución de {y_column.replace("_", " ").title()} - Los Ríos',
+            title=title or f'Evolución de {label} - Los Ríos',
             xaxis_title='Período',
-            yaxis_title=y_column.replace('_', ' ').title(),
+            yaxis_title=label,
             template='plotly_white',
             height=600,
             font=dict(size=12)
@@ -196,39 +589,47 @@ class ChartFactory:
     
     def _create_plotly_gender_comparison(self, data: pd.DataFrame) -> go.Figure:
         """Crea comparación por género con Plotly."""
-        fig = go.Figure()
-        
-        # Línea para hombres
-        fig.add_trace(go.Scatter(
-            x=data['ano_trimestre'],
-            y=data['hombres'],
-            mode='lines+markers',
-            name='Hombres',
-            line=dict(color='blue', width=3),
-            marker=dict(size=8)
-        ))
-        
-        # Línea para mujeres
-        fig.add_trace(go.Scatter(
-            x=data['ano_trimestre'],
-            y=data['mujeres'],
-            mode='lines+markers',
-            name='Mujeres',
-            line=dict(color='red', width=3),
-            marker=dict(size=8)
-        ))
-        
-        # Área sombreada entre las líneas
-        fig.add_trace(go.Scatter(
-            x=data['ano_trimestre'].tolist() + data['ano_trimestre'].tolist()[::-1],
-            y=data['hombres'].tolist() + data['mujeres'].tolist()[::-1],
-            fill='toself',
-            fillcolor='rgba(128,128,128,0.2)',
-            line=dict(color='rgba(255,255,255,0)'),
-            name='Brecha de género',
-            showlegend=False
-        ))
-        
+        # Polígono de la brecha: ida por hombres y vuelta por mujeres,
+        # concatenando los arrays sin pasar por listas de Python
+        periods = data['ano_trimestre'].to_numpy()
+        men = data['hombres'].to_numpy()
+        women = data['mujeres'].to_numpy()
+        gap_x = np.concatenate([periods, periods[::-1]])
+        gap_y = np.concatenate([men, women[::-1]])
+        scatter = go.Scattergl if len(data) > _WEBGL_THRESHOLD else go.Scatter
+        
+        traces = [
+            # Línea para hombres
+            scatter(
+                x=periods,
+                y=men,
+                mode='lines+markers',
+                name='Hombres',
+                line=dict(color='blue', width=3),
+                marker=dict(size=8)
+            ),
+            # Línea para mujeres
+            scatter(
+                x=periods,
+                y=women,
+                mode='lines+markers',
+                name='Mujeres',
+                line=dict(color='red', width=3),
+                marker=dict(size=8)
+            ),
+            # Área sombreada entre las líneas
+            scatter(
+                x=gap_x,
+                y=gap_y,
+                fill='toself',
+                fillcolor='rgba(128,128,128,0.2)',
+                line=dict(color='rgba(255,255,255,0)'),
+                name='Brecha de género',
+                showlegend=False
+            )
+        ]
+        
+        fig = go.Figure(data=traces)
         fig.update_layout(
             title='Participación Laboral por Género - Los Ríos',
             xaxis_title='Período',
@@ -240,20 +641,122 @@ class ChartFactory:
         
         return fig
     
+    @staticmethod
+    def _layout_dict(title: str, xaxis_title: str, yaxis_title: str) -> Dict[str, Any]:
+        """
+        Layout de Plotly ya normalizado, como lo deja fig.to_dict().
+        
+        La plantilla va resuelta: plotly.js no reconoce nombres de plantilla.
+        """
+        return {
+            'title': {'text': title},
+            'xaxis': {'title': {'text': xaxis_title}},
+            'yaxis': {'title': {'text': yaxis_title}},
+            'template': pio.templates['plotly_white'].to_plotly_json(),
+            'height': 600,
+            'font': {'size': 12}
+        }
+    
+    def _build_time_series_dict(
+        self,
+        data: pd.DataFrame,
+        y_column: str,
+        title: str = None
+    ) -> Dict[str, Any]:
+        """
+        Serie temporal como dict de Plotly, sin pasar por go.Scatter.
+        
+        Equivale a _create_plotly_time_series(...).to_dict() pero evita la
+        validación de propiedades de cada traza.
+        """
+        label = _column_label(y_column)
+        trace_type = 'scattergl' if len(data) > _WEBGL_THRESHOLD else 'scatter'
+        periods = data['ano_trimestre'].to_numpy()
+        values = data[y_column].to_numpy()
+        
+        traces = [{
+            'type': trace_type,
+            'x': periods,
+            'y': values,
+            'mode': 'lines+markers',
+            'name': label,
+            'line': {'color': self.viz_config.PRIMARY_COLOR, 'width': 3},
+            'marker': {'size': 8}
+        }]
+        
+        if len(data) > 2:
+            traces.append({
+                'type': trace_type,
+                'x': periods,
+                'y': self._linear_trend(values),
+                'mode': 'lines',
+                'name': 'Tendencia',
+                'line': {'color': 'red', 'width': 2, 'dash': 'dash'},
+                'opacity': 0.7
+            })
+        
+        return {
+            'data': traces,
+            'layout': self._layout_dict(
+                title or f'Evolución de {label} - Los Ríos', 'Período', label
+            )
+        }
+    
+    def _build_gender_comparison_dict(self, data: pd.DataFrame) -> Dict[str, Any]:
+        """Comparación por género como dict de Plotly, sin pasar por go.Scatter."""
+        trace_type = 'scattergl' if len(data) > _WEBGL_THRESHOLD else 'scatter'
+        periods = data['ano_trimestre'].to_numpy()
+        men = data['hombres'].to_numpy()
+        women = data['mujeres'].to_numpy()
+        
+        traces = [
+            {
+                'type': trace_type, 'x': periods, 'y': men,
+                'mode': 'lines+markers', 'name': 'Hombres',
+                'line': {'color': 'blue', 'width': 3}, 'marker': {'size': 8}
+            },
+            {
+                'type': trace_type, 'x': periods, 'y': women,
+                'mode': 'lines+markers', 'name': 'Mujeres',
+                'line': {'color': 'red', 'width': 3}, 'marker': {'size': 8}
+            },
+            {
+                'type': trace_type,
+                'x': np.concatenate([periods, periods[::-1]]),
+                'y': np.concatenate([men, women[::-1]]),
+                'fill': 'toself',
+                'fillcolor': 'rgba(128,128,128,0.2)',
+                'line': {'color': 'rgba(255,255,255,0)'},
+                'name': 'Brecha de género',
+                'showlegend': False
+            }
+        ]
+        
+        return {
+            'data': traces,
+            'layout': self._layout_dict(
+                'Participación Laboral por Género - Los Ríos', 'Período', 'Número de Personas'
+            )
+        }
+    
     def _create_plotly_distribution(self, data: pd.Series, bins: int) -> go.Figure:
         """Crea distribución con Plotly."""
-        fig = go.Figure()
-        
-        fig.add_trace(go.Histogram(
-            x=data,
-            nbinsx=bins,
+        # Histograma calculado en NumPy: la figura lleva O(bins) barras en
+        # lugar de la serie completa para que Plotly.js la agrupe
+        values = data.dropna().to_numpy(dtype=np.float64)
+        counts, edges = np.histogram(values, bins=bins)
+        
+        fig = go.Figure(data=[go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
             name='Distribución',
             marker_color=self.viz_config.PRIMARY_COLOR,
             opacity=0.7
-        ))
+        )])
         
         # Añadir línea de media
-        mean_value = data.mean()
+        mean_value = values.mean() if values.size else np.nan
         fig.add_vline(
             x=mean_value,
             line_dash="dash",
@@ -273,13 +776,16 @@ class ChartFactory:
     
     def _create_plotly_heatmap(self, correlation_matrix: pd.DataFrame) -> go.Figure:
         """Crea mapa de calor con Plotly."""
+        # Valores y etiquetas extraídos una vez; el texto se redondea sobre el
+        # ndarray sin crear un DataFrame intermedio
+        values = correlation_matrix.to_numpy()
         fig = go.Figure(data=go.Heatmap(
-            z=correlation_matrix.values,
-            x=correlation_matrix.columns,
-            y=correlation_matrix.index,
+            z=values,
+            x=correlation_matrix.columns.to_numpy(),
+            y=correlation_matrix.index.to_numpy(),
             colorscale='RdBu',
             zmid=0,
-            text=correlation_matrix.round(3).values,
+            text=np.round(values, 3),
             texttemplate="%{text}",
             textfont={"size": 10},
             colorbar=dict(title="Correlación")
@@ -301,36 +807,37 @@ class ChartFactory:
             subplot_titles=['Serie Original', 'Cambios Porcentuales'],
             vertical_spacing=0.1
         )
-        
-        # Serie original
-        fig.add_trace(
-            go.Scatter(
-                x=data['ano_trimestre'],
-                y=data[y_column],
-                mode='lines+markers',
-                name='Original',
-                line=dict(color=self.viz_config.PRIMARY_COLOR, width=2)
-            ),
-            row=1, col=1
-        )
+        column = data[y_column]
+        periods = data['ano_trimestre'].to_numpy()
         
         # Cambios porcentuales
-        pct_changes = data[y_column].pct_change() * 100
-        colors = ['green' if x > 0 else 'red' for x in pct_changes]
-        
-        fig.add_trace(
-            go.Bar(
-                x=data['ano_trimestre'],
-                y=pct_changes,
-                name='Cambio %',
-                marker_color=colors,
-                opacity=0.7
-            ),
-            row=2, col=1
+        pct_changes = self._percent_changes(column)
+        colors = np.where(pct_changes > 0, 'green', 'red')
+        
+        # Ambas trazas se agregan en una sola llamada (una validación)
+        fig.add_traces(
+            [
+                # Serie original
+                go.Scatter(
+                    x=periods,
+                    y=column.to_numpy(),
+                    mode='lines+markers',
+                    name='Original',
+                    line=dict(color=self.viz_config.PRIMARY_COLOR, width=2)
+                ),
+                go.Bar(
+                    x=periods,
+                    y=pct_changes,
+                    name='Cambio %',
+                    marker_color=colors,
+                    opacity=0.7
+                )
+            ],
+            rows=[1, 2], cols=[1, 1]
         )
         
         fig.update_layout(
-            title=f'Análisis de Tendencia - {y_column.replace("_", " ").title()}',
+            title=f'Análisis de Tendencia - {_column_label(y_column)}',
             template='plotly_white',
             height=800,
             showlegend=False
@@ -345,32 +852,34 @@ class ChartFactory:
         title: str = None
     ) -> plt.Figure:
         """Crea serie temporal con Matplotlib."""
-        fig, ax = plt.subplots(figsize=(12, 6))
+        label = _column_label(y_column)
+        fig, ax = self._get_fig(figsize=(12, 6))
         
-        ax.plot(data['ano_trimestre'], data[y_column], 
+        ax.plot(data['ano_trimestre'].to_numpy(), data[y_column].to_numpy(), 
                 marker='o', linewidth=2, markersize=6)
         
-        ax.set_title(title or f'Evolución de {y_column.replace("_", " ").title()} - Los Ríos')
+        ax.set_title(title or f'Evolución de {label} - Los Ríos')
         ax.set_xlabel('Período')
-        ax.set_ylabel(y_column.replace('_', ' ').title())
+        ax.set_ylabel(label)
         ax.grid(True, alpha=0.3)
         
         # Rotar etiquetas del eje x
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        
+        ax.tick_params(axis='x', labelrotation=45)
         return fig
     
     def _create_matplotlib_gender_comparison(self, data: pd.DataFrame) -> plt.Figure:
         """Crea comparación por género con Matplotlib."""
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = self._get_fig(figsize=(12, 6))
+        periods = data['ano_trimestre'].to_numpy()
+        men = data['hombres'].to_numpy()
+        women = data['mujeres'].to_numpy()
         
-        ax.plot(data['ano_trimestre'], data['hombres'], 
+        ax.plot(periods, men, 
                 marker='o', linewidth=2, label='Hombres', color='blue')
-        ax.plot(data['ano_trimestre'], data['mujeres'], 
+        ax.plot(periods, women, 
                 marker='s', linewidth=2, label='Mujeres', color='red')
         
-        ax.fill_between(data['ano_trimestre'], data['hombres'], data['mujeres'], 
+        ax.fill_between(periods, men, women, 
                        alpha=0.3, color='gray')
         
         ax.set_title('Participación Laboral por Género - Los Ríos')
@@ -379,18 +888,17 @@ class ChartFactory:
         ax.legend()
         ax.grid(True, alpha=0.3)
         
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        
+        ax.tick_params(axis='x', labelrotation=45)
         return fig
     
     def _create_matplotlib_distribution(self, data: pd.Series, bins: int) -> plt.Figure:
         """Crea distribución con Matplotlib."""
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._get_fig(figsize=(10, 6))
         
+        mean_value = data.mean()
         ax.hist(data, bins=bins, alpha=0.7, color=self.viz_config.PRIMARY_COLOR, edgecolor='black')
-        ax.axvline(data.mean(), color='red', linestyle='--', 
-                  label=f'Media: {data.mean():.0f}')
+        ax.axvline(mean_value, color='red', linestyle='--', 
+                  label=f'Media: {mean_value:.0f}')
         
         ax.set_title(f'Distribución de {data.name or "Valores"}')
         ax.set_xlabel('Valor')
@@ -398,13 +906,13 @@ class ChartFactory:
         ax.legend()
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        
         return fig
     
     def _create_matplotlib_heatmap(self, correlation_matrix: pd.DataFrame) -> plt.Figure:
         """Crea mapa de calor con Matplotlib."""
-        fig, ax = plt.subplots(figsize=(10, 8))
+        import seaborn as sns
+        
+        fig, ax = self._get_fig(figsize=(10, 8))
         
         sns.heatmap(correlation_matrix, 
                    annot=True, 
@@ -414,32 +922,46 @@ class ChartFactory:
                    ax=ax)
         
         ax.set_title('Matriz de Correlaciones')
-        plt.tight_layout()
-        
         return fig
     
     def _create_matplotlib_trend_analysis(self, data: pd.DataFrame, y_column: str) -> plt.Figure:
         """Crea análisis de tendencia con Matplotlib."""
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+        fig, (ax1, ax2) = self._get_fig(2, 1, figsize=(12, 10))
+        column = data[y_column]
+        periods = data['ano_trimestre'].to_numpy()
         
         # Serie original
-        ax1.plot(data['ano_trimestre'], data[y_column], 
+        ax1.plot(periods, column.to_numpy(), 
                 marker='o', linewidth=2)
         ax1.set_title('Serie Original')
-        ax1.set_ylabel(y_column.replace('_', ' ').title())
+        ax1.set_ylabel(_column_label(y_column))
         ax1.grid(True, alpha=0.3)
         
         # Cambios porcentuales
-        pct_changes = data[y_column].pct_change() * 100
-        colors = ['green' if x > 0 else 'red' for x in pct_changes]
-        ax2.bar(data['ano_trimestre'], pct_changes, color=colors, alpha=0.7)
+        pct_changes = self._percent_changes(column)
+        colors = np.where(pct_changes > 0, 'green', 'red')
+        ax2.bar(periods, pct_changes, color=colors, alpha=0.7)
         ax2.set_title('Cambios Porcentuales')
         ax2.set_xlabel('Período')
         ax2.set_ylabel('Cambio %')
         ax2.grid(True, alpha=0.3)
         ax2.axhline(y=0, color='black', linestyle='-', alpha=0.5)
         
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        
+        ax2.tick_params(axis='x', labelrotation=45)
         return fig
+
+
+# Factory de cada proceso trabajador de build_many (una por proceso)
+_worker_factory: Optional[ChartFactory] = None
+
+
+def _init_chart_worker(config: LosRiosConfig) -> None:
+    """Crea la factory del proceso trabajador."""
+    global _worker_factory
+    _worker_factory = ChartFactory(config)
+
+
+def _build_chart_in_worker(spec: tuple) -> Any:
+    """Construye en el proceso trabajador el gráfico descrito por spec."""
+    method_name, args, kwargs = spec
+    return _worker_factory.dispatch(method_name, *args, **kwargs)
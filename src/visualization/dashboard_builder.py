@@ -4,15 +4,21 @@ Clean Code: Builder Pattern para crear dashboards complejos
 """
 
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import plotly.express as px
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
+from functools import partial
 import logging
 
 from ...config import LosRiosConfig, VisualizationConfig
 from ..utils.logger import setup_logger
-from .chart_factory import ChartFactory
+from ..utils.helpers import HelperFunctions
+from .chart_factory import ChartFactory, _WEBGL_THRESHOLD
+
+# Máximo de puntos por línea del dashboard; las series más largas se
+# muestrean con LTTB para acotar el HTML y el tiempo de dibujo
+_MAX_LINE_POINTS = 1000
 
 
 class DashboardBuilder:
@@ -32,56 +38,42 @@ class DashboardBuilder:
     def create_comprehensive_dashboard(
         self, 
         data: pd.DataFrame,
-        analysis_results: Dict[str, Any]
-    ) -> go.Figure:
+        analysis_results: Dict[str, Any],
+        lazy: bool = False
+    ) -> Union[go.Figure, Dict[str, Callable[[], go.Figure]]]:
         """
         Crea dashboard completo del análisis.
         
         Args:
             data: DataFrame con datos de Los Ríos
             analysis_results: Resultados del análisis
+            lazy: Si retornar un constructor por panel en lugar de la figura
             
         Returns:
-            Dashboard interactivo de Plotly
+            Dashboard interactivo de Plotly o, con lazy=True, un dict
+            {nombre_panel: función sin argumentos que construye ese panel}
+            para que el cliente (p. ej. Dash) dibuje cada uno al mostrarlo
         """
         try:
-            # Crear subplots
+            panels = self._comprehensive_panels(data, analysis_results)
+            if lazy:
+                return {
+                    name: partial(self._build_panel, title, spec, add_traces)
+                    for name, title, spec, add_traces in panels
+                }
+            
+            # Crear subplots (dos paneles por fila)
+            specs = [panel[2] for panel in panels]
             fig = make_subplots(
                 rows=3, cols=2,
-                subplot_titles=[
-                    'Evolución de la Fuerza de Trabajo',
-                    'Distribución por Género',
-                    'Tendencias por Género',
-                    'Cambios Porcentuales',
-                    'Indicadores Clave',
-                    'Proyecciones'
-                ],
-                specs=[
-                    [{"secondary_y": False}, {"secondary_y": False}],
-                    [{"secondary_y": False}, {"secondary_y": False}],
-                    [{"type": "indicator"}, {"secondary_y": False}]
-                ],
+                subplot_titles=[panel[1] for panel in panels],
+                specs=[specs[k:k + 2] for k in range(0, len(specs), 2)],
                 vertical_spacing=0.08,
                 horizontal_spacing=0.08
             )
             
-            # 1. Evolución de la fuerza de trabajo
-            self._add_labour_force_evolution(fig, data, row=1, col=1)
-            
-            # 2. Distribución por género (pie chart)
-            self._add_gender_distribution(fig, data, row=1, col=2)
-            
-            # 3. Tendencias por género
-            self._add_gender_trends(fig, data, row=2, col=1)
-            
-            # 4. Cambios porcentuales
-            self._add_percentage_changes(fig, data, row=2, col=2)
-            
-            # 5. Indicadores clave
-            self._add_key_indicators(fig, analysis_results, row=3, col=1)
-            
-            # 6. Proyecciones
-            self._add_forecasts(fig, data, analysis_results, row=3, col=2)
+            for position, (_, _, _, add_traces) in enumerate(panels):
+                add_traces(fig, row=position // 2 + 1, col=position % 2 + 1)
             
             # Configurar layout
             fig.update_layout(
@@ -94,7 +86,8 @@ class DashboardBuilder:
                 template='plotly_white',
                 height=1200,
                 showlegend=True,
-                font=dict(size=11)
+                font=dict(size=11),
+                uirevision='constant'
             )
             
             return fig
@@ -103,9 +96,60 @@ class DashboardBuilder:
             self.logger.error(f"Error creando dashboard: {str(e)}")
             raise
     
+    def _comprehensive_panels(
+        self,
+        data: pd.DataFrame,
+        analysis_results: Dict[str, Any]
+    ) -> List[Tuple[str, str, Dict[str, Any], Callable[..., None]]]:
+        """
+        Paneles del dashboard completo, en orden de grilla.
+        
+        Cada panel es (nombre, título, spec de make_subplots, función que
+        agrega sus trazas a una figura en (row, col)).
+        """
+        return [
+            # 1. Evolución de la fuerza de trabajo
+            ('labour_force_evolution', 'Evolución de la Fuerza de Trabajo', {"type": "xy"},
+             partial(self._add_labour_force_evolution, data=data)),
+            # 2. Distribución por género (pie chart)
+            ('gender_distribution', 'Distribución por Género', {"type": "domain"},
+             partial(self._add_gender_distribution, data=data)),
+            # 3. Tendencias por género
+            ('gender_trends', 'Tendencias por Género', {"type": "xy"},
+             partial(self._add_gender_trends, data=data)),
+            # 4. Cambios porcentuales
+            ('percentage_changes', 'Cambios Porcentuales', {"type": "xy"},
+             partial(self._add_percentage_changes, data=data)),
+            # 5. Indicadores clave
+            ('key_indicators', 'Indicadores Clave', {"type": "indicator"},
+             partial(self._add_key_indicators, analysis_results=analysis_results)),
+            # 6. Proyecciones
+            ('forecasts', 'Proyecciones', {"type": "xy"},
+             partial(self._add_forecasts, data=data, analysis_results=analysis_results))
+        ]
+    
+    def _build_panel(
+        self,
+        title: str,
+        spec: Dict[str, Any],
+        add_traces: Callable[..., None]
+    ) -> go.Figure:
+        """Construye un panel del dashboard completo como figura independiente."""
+        fig = make_subplots(rows=1, cols=1, specs=[[spec]], subplot_titles=[title])
+        add_traces(fig, row=1, col=1)
+        fig.update_layout(
+            template='plotly_white',
+            height=450,
+            showlegend=True,
+            font=dict(size=11),
+            uirevision='constant'
+        )
+        return fig
+    
     def create_gender_analysis_dashboard(self, data: pd.DataFrame) -> go.Figure:
         """Crea dashboard específico para análisis de género."""
         try:
+            scatter = self._scatter_type(data)
             fig = make_subplots(
                 rows=2, cols=2,
                 subplot_titles=[
@@ -119,9 +163,8 @@ class DashboardBuilder:
             
             # Evolución comparativa
             fig.add_trace(
-                go.Scatter(
-                    x=data['ano_trimestre'],
-                    y=data['hombres'],
+                scatter(
+                    **self._line_points(data, 'hombres'),
                     mode='lines+markers',
                     name='Hombres',
                     line=dict(color='blue', width=3)
@@ -130,9 +173,8 @@ class DashboardBuilder:
             )
             
             fig.add_trace(
-                go.Scatter(
-                    x=data['ano_trimestre'],
-                    y=data['mujeres'],
+                scatter(
+                    **self._line_points(data, 'mujeres'),
                     mode='lines+markers',
                     name='Mujeres',
                     line=dict(color='red', width=3)
@@ -145,9 +187,8 @@ class DashboardBuilder:
             female_pct = (data['mujeres'] / data['fuerza_de_trabajo']) * 100
             
             fig.add_trace(
-                go.Scatter(
-                    x=data['ano_trimestre'],
-                    y=male_pct,
+                scatter(
+                    **self._line_points(data, male_pct),
                     mode='lines',
                     name='% Hombres',
                     line=dict(color='blue', width=2)
@@ -156,9 +197,8 @@ class DashboardBuilder:
             )
             
             fig.add_trace(
-                go.Scatter(
-                    x=data['ano_trimestre'],
-                    y=female_pct,
+                scatter(
+                    **self._line_points(data, female_pct),
                     mode='lines',
                     name='% Mujeres',
                     line=dict(color='red', width=2)
@@ -169,9 +209,8 @@ class DashboardBuilder:
             # Brecha de género
             gender_gap = abs(data['hombres'] - data['mujeres'])
             fig.add_trace(
-                go.Scatter(
-                    x=data['ano_trimestre'],
-                    y=gender_gap,
+                scatter(
+                    **self._line_points(data, gender_gap),
                     mode='lines+markers',
                     name='Brecha Absoluta',
                     line=dict(color='purple', width=2),
@@ -210,7 +249,8 @@ class DashboardBuilder:
                 title='Análisis de Género - Fuerza de Trabajo Los Ríos',
                 template='plotly_white',
                 height=800,
-                showlegend=True
+                showlegend=True,
+                uirevision='constant'
             )
             
             return fig
@@ -222,6 +262,7 @@ class DashboardBuilder:
     def create_trend_analysis_dashboard(self, data: pd.DataFrame) -> go.Figure:
         """Crea dashboard de análisis de tendencias."""
         try:
+            scatter = self._scatter_type(data)
             fig = make_subplots(
                 rows=2, cols=2,
                 subplot_titles=[
@@ -234,9 +275,8 @@ class DashboardBuilder:
             
             # Serie original con tendencia
             fig.add_trace(
-                go.Scatter(
-                    x=data['ano_trimestre'],
-                    y=data['fuerza_de_trabajo'],
+                scatter(
+                    **self._line_points(data, 'fuerza_de_trabajo'),
                     mode='lines+markers',
                     name='Datos Originales',
                     line=dict(color=self.viz_config.PRIMARY_COLOR, width=2)
@@ -244,16 +284,15 @@ class DashboardBuilder:
                 row=1, col=1
             )
             
-            # Línea de tendencia
-            import numpy as np
-            x_numeric = np.arange(len(data))
-            z = np.polyfit(x_numeric, data['fuerza_de_trabajo'], 1)
-            trend_line = np.poly1d(z)(x_numeric)
+            # Línea de tendencia: mínimos cuadrados en forma cerrada, sin el
+            # SVD de np.polyfit (misma recta que usa ChartFactory)
+            trend_line = self.chart_factory._linear_trend(
+                data['fuerza_de_trabajo'].to_numpy(dtype=float)
+            )
             
             fig.add_trace(
-                go.Scatter(
-                    x=data['ano_trimestre'],
-                    y=trend_line,
+                scatter(
+                    **self._line_points(data, trend_line),
                     mode='lines',
                     name='Tendencia Lineal',
                     line=dict(color='red', width=2, dash='dash')
@@ -264,9 +303,8 @@ class DashboardBuilder:
             # Media móvil
             rolling_mean = data['fuerza_de_trabajo'].rolling(window=4).mean()
             fig.add_trace(
-                go.Scatter(
-                    x=data['ano_trimestre'],
-                    y=rolling_mean,
+                scatter(
+                    **self._line_points(data, rolling_mean),
                     mode='lines',
                     name='Media Móvil (4 períodos)',
                     line=dict(color='green', width=2)
@@ -277,9 +315,8 @@ class DashboardBuilder:
             # Desviación estándar móvil
             rolling_std = data['fuerza_de_trabajo'].rolling(window=4).std()
             fig.add_trace(
-                go.Scatter(
-                    x=data['ano_trimestre'],
-                    y=rolling_std,
+                scatter(
+                    **self._line_points(data, rolling_std),
                     mode='lines',
                     name='Volatilidad (4 períodos)',
                     line=dict(color='orange', width=2)
@@ -288,14 +325,18 @@ class DashboardBuilder:
             )
             
             # Detección de outliers
-            from ..utils.helpers import HelperFunctions
-            helpers = HelperFunctions()
-            outliers = helpers.detect_outliers(data['fuerza_de_trabajo'])
+            outliers = HelperFunctions.detect_outliers(data['fuerza_de_trabajo']).to_numpy()
+            
+            # La partición normales/outliers se hace una vez sobre ndarrays,
+            # sin volver a indexar el DataFrame con cada máscara
+            periods = data['ano_trimestre'].to_numpy()
+            values = data['fuerza_de_trabajo'].to_numpy()
+            normal = ~outliers
             
             fig.add_trace(
-                go.Scatter(
-                    x=data['ano_trimestre'][~outliers],
-                    y=data['fuerza_de_trabajo'][~outliers],
+                scatter(
+                    x=periods[normal],
+                    y=values[normal],
                     mode='markers',
                     name='Valores Normales',
                     marker=dict(color='blue', size=6)
@@ -305,9 +346,9 @@ class DashboardBuilder:
             
             if outliers.any():
                 fig.add_trace(
-                    go.Scatter(
-                        x=data['ano_trimestre'][outliers],
-                        y=data['fuerza_de_trabajo'][outliers],
+                    scatter(
+                        x=periods[outliers],
+                        y=values[outliers],
                         mode='markers',
                         name='Outliers',
                         marker=dict(color='red', size=10, symbol='x')
@@ -318,7 +359,8 @@ class DashboardBuilder:
             fig.update_layout(
                 title='Análisis de Tendencias - Fuerza de Trabajo Los Ríos',
                 template='plotly_white',
-                height=800
+                height=800,
+                uirevision='constant'
             )
             
             return fig
@@ -327,12 +369,40 @@ class DashboardBuilder:
             self.logger.error(f"Error creando dashboard de tendencias: {str(e)}")
             raise
     
+    @staticmethod
+    def _scatter_type(data: pd.DataFrame) -> type:
+        """Scattergl (WebGL) para datos extensos; Scatter (SVG) en otro caso."""
+        return go.Scattergl if len(data) > _WEBGL_THRESHOLD else go.Scatter
+    
+    @staticmethod
+    def _line_points(
+        data: pd.DataFrame,
+        values: Union[str, pd.Series, np.ndarray]
+    ) -> Dict[str, Any]:
+        """
+        Argumentos x/y de una línea temporal, muestreados con LTTB si la
+        serie supera _MAX_LINE_POINTS (las series cortas pasan intactas).
+        
+        Args:
+            data: DataFrame con la columna de períodos
+            values: Nombre de columna o serie alineada con data
+        """
+        if isinstance(values, str):
+            values = data[values]
+        if len(data) <= _MAX_LINE_POINTS:
+            return {'x': data['ano_trimestre'], 'y': values}
+        
+        if isinstance(values, pd.Series):
+            values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        keep = HelperFunctions.lttb_indices(values, _MAX_LINE_POINTS)
+        return {'x': data['ano_trimestre'].to_numpy()[keep], 'y': np.asarray(values)[keep]}
+    
     def _add_labour_force_evolution(self, fig: go.Figure, data: pd.DataFrame, row: int, col: int):
         """Añade evolución de fuerza de trabajo al dashboard."""
+        scatter = self._scatter_type(data)
         fig.add_trace(
-            go.Scatter(
-                x=data['ano_trimestre'],
-                y=data['fuerza_de_trabajo'],
+            scatter(
+                **self._line_points(data, 'fuerza_de_trabajo'),
                 mode='lines+markers',
                 name='Fuerza de Trabajo',
                 line=dict(color=self.viz_config.PRIMARY_COLOR, width=3),
@@ -357,10 +427,10 @@ class DashboardBuilder:
     
     def _add_gender_trends(self, fig: go.Figure, data: pd.DataFrame, row: int, col: int):
         """Añade tendencias por género."""
+        scatter = self._scatter_type(data)
         fig.add_trace(
-            go.Scatter(
-                x=data['ano_trimestre'],
-                y=data['hombres'],
+            scatter(
+                **self._line_points(data, 'hombres'),
                 mode='lines',
                 name='Hombres',
                 line=dict(color='blue', width=2)
@@ -369,9 +439,8 @@ class DashboardBuilder:
         )
         
         fig.add_trace(
-            go.Scatter(
-                x=data['ano_trimestre'],
-                y=data['mujeres'],
+            scatter(
+                **self._line_points(data, 'mujeres'),
                 mode='lines',
                 name='Mujeres',
                 line=dict(color='red', width=2)
@@ -412,11 +481,11 @@ class DashboardBuilder:
     
     def _add_forecasts(self, fig: go.Figure, data: pd.DataFrame, analysis_results: Dict[str, Any], row: int, col: int):
         """Añade proyecciones."""
+        scatter = self._scatter_type(data)
         # Serie histórica
         fig.add_trace(
-            go.Scatter(
-                x=data['ano_trimestre'],
-                y=data['fuerza_de_trabajo'],
+            scatter(
+                **self._line_points(data, 'fuerza_de_trabajo'),
                 mode='lines',
                 name='Histórico',
                 line=dict(color='blue', width=2)
@@ -437,7 +506,7 @@ class DashboardBuilder:
                 ]
                 
                 fig.add_trace(
-                    go.Scatter(
+                    scatter(
                         x=next_periods,
                         y=projected_values,
                         mode='lines+markers',
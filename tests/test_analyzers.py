@@ -87,6 +87,58 @@ class TestLabourAnalyzer(unittest.TestCase):
         # Verificar que la tendencia es creciente (datos de prueba van en aumento)
         self.assertEqual(total_trend['trend_direction'], 'increasing')
     
+    def test_filtered_data_dtypes(self):
+        """Test de los tipos que deja el filtrado de Los Ríos."""
+        filtered = self.analyzer._filter_los_rios_data(self.test_data.iloc[::-1])
+        
+        # Períodos como categórico ordenado y ordenados cronológicamente
+        periods = filtered['ano_trimestre']
+        self.assertIsInstance(periods.dtype, pd.CategoricalDtype)
+        self.assertTrue(periods.cat.ordered)
+        self.assertEqual(periods.iloc[0], '2022-Q1')
+        self.assertEqual(periods.max(), '2024-Q4')
+        
+        # Conteos en int32 (no se reducen más aunque los valores quepan)
+        for column in ['fuerza_de_trabajo', 'hombres', 'mujeres']:
+            self.assertEqual(filtered[column].dtype, np.int32)
+        small = self.test_data.assign(hombres=1, mujeres=pd.array([1, None] * 6, dtype='Int64'))
+        filtered = self.analyzer._filter_los_rios_data(small)
+        self.assertEqual(filtered['hombres'].dtype, np.int32)
+        self.assertEqual(filtered['mujeres'].dtype, 'Int32')
+        
+        # Los metadatos de calidad reportan los tipos nuevos
+        validity = self.analyzer.analyze_labour_market(self.test_data)[
+            'metadata']['data_quality']['data_quality']['validity']
+        self.assertEqual(validity['ano_trimestre'], 'category')
+        self.assertEqual(validity['fuerza_de_trabajo'], 'int32')
+    
+    def test_analysis_with_nullable_counts(self):
+        """Test del análisis con conteos enteros nulables y valores faltantes."""
+        data = self.test_data.astype({'fuerza_de_trabajo': 'Int64', 'mujeres': 'Int64'})
+        data.loc[3, 'fuerza_de_trabajo'] = pd.NA
+        data.loc[5, 'mujeres'] = pd.NA
+        results = self.analyzer.analyze_labour_market(data)
+        
+        trends = results['historical_trends']
+        self.assertNotIn('error', trends)
+        self.assertNotIn('error', results['seasonal_patterns'])
+        self.assertEqual(trends['total_labour_force']['trend_direction'], 'increasing')
+    
+    def test_trend_direction_with_missing_values(self):
+        """Test de dirección de tendencia con valores faltantes."""
+        values = np.array([100.0, np.nan, 110.0, 115.0, np.nan, 125.0])
+        self.assertEqual(self.analyzer._determine_trend_direction(values), 'increasing')
+        
+        # Sin dos puntos válidos no hay pendiente que interpretar
+        values = np.array([np.nan, 100.0, np.nan])
+        self.assertEqual(self.analyzer._determine_trend_direction(values), 'insufficient_data')
+    
+    def test_period_quarter_codes(self):
+        """Test de códigos de trimestre para sufijos "Qn" y meses del INE."""
+        periods = pd.Series(['2023-MAR', '2023-Q3', '2023-DIC', None])
+        codes = self.analyzer._period_quarter_codes(periods, ['Q1', 'Q2', 'Q3', 'Q4'])
+        self.assertEqual(codes.tolist(), [0, 2, 3, 0])
+    
     def test_gender_analysis(self):
         """Test de análisis de género."""
         results = self.analyzer.analyze_labour_market(self.test_data)
@@ -209,6 +261,13 @@ class TestStatisticsEngine(unittest.TestCase):
         # Verificar que encuentra correlaciones fuertes
         strongest_corrs = corr_analysis['strongest_correlations']
         self.assertGreater(len(strongest_corrs), 0)
+        
+        # Columnas enteras nullable con NA: correlación por pares de pandas
+        nullable_df = test_df.astype('Int64')
+        nullable_df.loc[2, 'var1'] = pd.NA
+        corr_analysis = self.engine.calculate_correlation_matrix(nullable_df)
+        self.assertIn('pearson', corr_analysis)
+        self.assertAlmostEqual(corr_analysis['pearson']['var1']['var2'], 1.0)
 
 
 class TestHelperFunctions(unittest.TestCase):
@@ -233,6 +292,41 @@ class TestHelperFunctions(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.helpers.parse_ine_period("invalid-format")
     
+    def test_parse_ine_periods(self):
+        """Test de parseo vectorizado de períodos del INE."""
+        periods = pd.Series(
+            ["2023-MAR", "2023-jun", "invalid-format", None, "2023-MAR"],
+            index=[10, 11, 12, 13, 14]
+        )
+        parsed = self.helpers.parse_ine_periods(periods)
+        
+        self.assertEqual(parsed.index.tolist(), [10, 11, 12, 13, 14])
+        self.assertEqual(parsed['year'].tolist(), [2023, 2023, pd.NA, pd.NA, 2023])
+        self.assertEqual(parsed['quarter'].tolist(), ["Q1", "Q2", pd.NA, pd.NA, "Q1"])
+        
+        # Coincide con la versión escalar en los períodos válidos
+        for period in ["2023-MAR", "2023-jun"]:
+            self.assertEqual(
+                tuple(parsed.loc[periods == period].iloc[0]),
+                self.helpers.parse_ine_period(period)
+            )
+    
+    def test_standardize_series(self):
+        """Test de estandarización vectorizada de textos."""
+        texts = pd.Series(["  Región de  Los Ríos! ", "ﬁ²", "Ñuble-Sur", "São  Paulo"])
+        expected = ["Region de Los Rios", "fi2", "Nuble-Sur", "Sao Paulo"]
+        
+        # NFKD descompone acentos y ligaduras/superíndices ('ﬁ²' -> 'fi2')
+        self.assertEqual(self.helpers.standardize_series(texts).tolist(), expected)
+        self.assertEqual([self.helpers.standardize_text(text) for text in texts], expected)
+        
+        # Columnas no textuales conservan la semántica escalar
+        self.assertEqual(self.helpers.standardize_series(pd.Series([1, None])).tolist(), ["1.0", "nan"])
+        
+        # En columnas 'string' los nulos se conservan
+        nullable = pd.Series(["Ríos", None], dtype='string')
+        self.assertEqual(self.helpers.standardize_series(nullable).isna().tolist(), [False, True])
+    
     def test_detect_outliers(self):
         """Test de detección de outliers."""
         # Serie con outlier obvio
@@ -244,6 +338,17 @@ class TestHelperFunctions(unittest.TestCase):
         
         # El valor 100 debería ser outlier
         self.assertTrue(outliers[series_with_outlier == 100].iloc[0])
+        
+        # Enteros nullable con NA: mismo resultado que la serie float
+        nullable = pd.Series([10, 12, 11, None, 13, 12, 100, 11, 10], dtype='Int64')
+        outliers = self.helpers.detect_outliers(nullable, method="iqr")
+        self.assertEqual(outliers.tolist(), [False] * 6 + [True, False, False])
+        
+        outliers = self.helpers.detect_outliers(nullable, method="modified_zscore")
+        self.assertEqual(
+            outliers.tolist(),
+            self.helpers.detect_outliers(nullable.astype(float), method="modified_zscore").tolist()
+        )
     
     def test_calculate_growth_rates(self):
         """Test de cálculo de tasas de crecimiento."""
@@ -259,6 +364,32 @@ class TestHelperFunctions(unittest.TestCase):
         # Verificar que detecta crecimiento
         self.assertGreater(growth_rates['total_growth_pct'], 0)
     
+    def test_create_summary_statistics(self):
+        """Test de estadísticas resumen numéricas (equivalentes a describe)."""
+        df = pd.DataFrame({
+            'valor': [10.0, 20.0, 30.0, 40.0, np.nan],
+            'region': ['CHL14'] * 5
+        })
+        summary = self.helpers.create_summary_statistics(df)
+        
+        self.assertIn('numeric_stats', summary)
+        stats = summary['numeric_stats']['valor']
+        expected = df['valor'].describe()
+        for name in ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']:
+            self.assertAlmostEqual(stats[name], expected[name])
+    
+    def test_calculate_period_differences(self):
+        """Test de diferencias período a período con enteros nulables."""
+        df = pd.DataFrame({
+            'ano_trimestre': ['2020-Q2', '2020-Q1', '2020-Q3'],
+            'valor': pd.Series([110, 100, None], dtype='Int64')
+        })
+        result = self.helpers.calculate_period_differences(df, 'valor')
+        
+        self.assertEqual(result['ano_trimestre'].tolist(), ['2020-Q1', '2020-Q2', '2020-Q3'])
+        np.testing.assert_allclose(result['valor_diff'], [np.nan, 10, np.nan])
+        np.testing.assert_allclose(result['valor_pct_change'], [np.nan, 10, np.nan])
+    
     def test_format_large_numbers(self):
         """Test de formateo de números grandes."""
         # Test diferentes escalas
@@ -266,6 +397,13 @@ class TestHelperFunctions(unittest.TestCase):
         self.assertEqual(self.helpers.format_large_numbers(1500000), "1.5M")
         self.assertEqual(self.helpers.format_large_numbers(1500000000), "1.5B")
         self.assertEqual(self.helpers.format_large_numbers(150), "150.0")
+        
+        # Versión vectorizada con enteros nulables (NA -> "N/A")
+        numbers = pd.Series([1500, None, 1500000], dtype='Int64')
+        self.assertEqual(
+            self.helpers.format_large_numbers_series(numbers).tolist(),
+            ["1.5K", "N/A", "1.5M"]
+        )
     
     def test_safe_divide(self):
         """Test de división segura."""
@@ -279,6 +417,29 @@ class TestHelperFunctions(unittest.TestCase):
         # Valores NaN
         self.assertEqual(self.helpers.safe_divide(np.nan, 2), 0.0)
         self.assertEqual(self.helpers.safe_divide(10, np.nan), 0.0)
+        
+        # Valores NA, texto y arrays retornan el valor por defecto
+        self.assertEqual(self.helpers.safe_divide(pd.NA, 2), 0.0)
+        self.assertEqual(self.helpers.safe_divide(10, pd.NA, default=-1), -1)
+        self.assertEqual(self.helpers.safe_divide("10", 2), 0.0)
+        self.assertEqual(self.helpers.safe_divide(np.array([1, 2]), 2), 0.0)
+        self.assertEqual(self.helpers.safe_divide(None, 2), 0.0)
+    
+    def test_lttb_indices(self):
+        """Test del muestreo LTTB para series largas."""
+        # Serie corta: se conservan todos los puntos
+        np.testing.assert_array_equal(self.helpers.lttb_indices([1, 2, 3], 10), [0, 1, 2])
+        
+        # Serie larga con un pico
+        values = np.sin(np.linspace(0, 20, 5000))
+        values[2500] = 10
+        indices = self.helpers.lttb_indices(values, 200)
+        
+        self.assertEqual(len(indices), 200)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 4999)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertIn(2500, indices)
 
 
 if __name__ == '__main__':
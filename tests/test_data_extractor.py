@@ -49,6 +49,25 @@ class TestLosRiosDataExtractor(unittest.TestCase):
         self.assertTrue(is_valid)
         self.assertEqual(len(errors), 0)
     
+    def test_validation_reflects_in_place_changes(self):
+        """Test de revalidación tras modificar el DataFrame in-place."""
+        test_data = pd.DataFrame({
+            'region': ['CHL14', 'CHL14'],
+            'ano_trimestre': ['2023-Q1', '2023-Q2'],
+            'fuerza_de_trabajo': [100000, 102000],
+            'hombres': [55000, 56000],
+            'mujeres': [45000, 46000]
+        })
+        
+        is_valid, _ = self.validator.validate_los_rios_data(test_data)
+        self.assertTrue(is_valid)
+        
+        # El mismo validador debe detectar el valor negativo introducido
+        test_data.loc[0, 'fuerza_de_trabajo'] = -50
+        is_valid, errors = self.validator.validate_los_rios_data(test_data)
+        self.assertFalse(is_valid)
+        self.assertGreater(len(errors), 0)
+    
     def test_los_rios_filtering(self):
         """Test de filtrado de datos de Los Ríos."""
         # Crear datos de prueba con múltiples regiones
@@ -150,6 +169,21 @@ class TestDataValidator(unittest.TestCase):
         self.assertEqual(report['dataframe_info']['rows'], 2)
         self.assertEqual(report['dataframe_info']['columns'], 5)
 
+    def test_validation_report_formatting(self):
+        """Test del resumen en texto del reporte de validación."""
+        report = {
+            'validations': {'basic_structure': True, 'data_consistency': False},
+            'overall_valid': False,
+            'errors': ['1 filas con inconsistencia en totales']
+        }
+
+        text = self.validator.format_validation_report(report)
+
+        self.assertIn('Basic Structure: PASS', text)
+        self.assertIn('Data Consistency: FAIL', text)
+        self.assertIn('1/2', text)
+        self.assertIn('1 filas con inconsistencia en totales', text)
+
 
 if __name__ == '__main__':
     # Configurar suite de tests